@@ -34,8 +34,8 @@ def jit_compile(source, filepath=None, objname=None):
 
     Parameters
     ----------
-    source : :any:`Sourcefile` or :any:`Module` or :any:`Subroutine`
-        The item to compile and load
+    source : :any:`Sourcefile` or :any:`Module` or :any:`Subroutine` or str
+        The item to compile and load, or the already generated Fortran code
     filepath : str or :any:`Path`, optional
         Path of the source file to write (default: hashed name in :any:`gettempdir()`)
     objname : str, optional
@@ -47,7 +47,8 @@ def jit_compile(source, filepath=None, objname=None):
             filepath = Path(gettempdir()/filehash(source, prefix='', suffix='.f90'))
         source.write(path=filepath)
     else:
-        source = fgen(source)
+        if not isinstance(source, str):
+            source = fgen(source)
         if filepath is None:
             filepath = gettempdir()/filehash(source, prefix='', suffix='.f90')
         else:
@@ -19,9 +19,9 @@ from pymbolic.mapper.stringifier import (
 )
 try:
     from fparser.two.Fortran2003 import Intrinsic_Name
-    _intrinsic_fortran_names = Intrinsic_Name.function_names
+    _intrinsic_fortran_names = frozenset(Intrinsic_Name.function_names)
 except ImportError:
-    _intrinsic_fortran_names = ()
+    _intrinsic_fortran_names = frozenset()
 
 from loki.logging import debug
 from loki.tools import as_tuple, flatten
@@ -805,7 +805,7 @@ class AttachScopesMapper(LokiIdentityMapper):
                 expr = expr.rescope(symbol_scope)
         elif self.fail:
             raise RuntimeError(f'AttachScopesMapper: {expr!s} was not found in any scope')
-        elif expr not in _intrinsic_fortran_names:
+        elif expr.name.upper() not in _intrinsic_fortran_names:
             debug('AttachScopesMapper: %s was not found in any scopes', str(expr))
         return expr
 
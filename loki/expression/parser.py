@@ -5,6 +5,7 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+from functools import lru_cache
 from sys import intern
 import re
 import math
@@ -34,6 +35,8 @@ from loki.scope import Scope
 
 __all__ = ['ExpressionParser', 'parse_expr', 'FORTRAN_INTRINSIC_PROCEDURES']
 
+_FORTRAN_INTRINSIC_NAMES = frozenset(FORTRAN_INTRINSIC_PROCEDURES)
+
 
 class PymbolicMapper(Mapper):
     """
@@ -130,7 +133,7 @@ class PymbolicMapper(Mapper):
         if isinstance(expr, pmbl.Call):
             if expr.function.name.lower() in ('real', 'int'):
                 return sym.Cast(expr.function.name, [self.rec(param, *args, **kwargs) for param in expr.parameter][0])
-            if expr.function.name.upper() in FORTRAN_INTRINSIC_PROCEDURES:
+            if expr.function.name.upper() in _FORTRAN_INTRINSIC_NAMES:
                 return sym.InlineCall(function=sym.Variable(name=expr.function.name),
                         parameters=tuple(self.rec(param, *args, **kwargs) for param in expr.parameters))
             parent = kwargs.pop('parent', None)
@@ -206,7 +209,7 @@ class LokiEvaluationMapper(EvaluationMapper):
     map_int_literal = map_float_literal
 
     def map_variable(self, expr):
-        if expr.name.upper() in FORTRAN_INTRINSIC_PROCEDURES:
+        if expr.name.upper() in _FORTRAN_INTRINSIC_NAMES:
             return self.map_call(expr)
         if self.strict:
             return super().map_variable(expr)
@@ -223,24 +226,25 @@ class LokiEvaluationMapper(EvaluationMapper):
         """
         return np.array(arr, order='F').item(*[dim-1 for dim in dims])
 
+    _intrinsic_functions = {
+        'min': lambda *args: min(args),
+        'max': lambda *args: max(args),
+        'modulo': lambda a, p, *_: a % p,
+        'abs': lambda a, *_: abs(float(a)),
+        'int': lambda a, *_: int(float(a)),
+        'real': lambda a, *_: float(a),
+        'sqrt': lambda a, *_: math.sqrt(float(a)),
+        'exp': lambda a, *_: math.exp(float(a)),
+    }
+    """
+    Python implementations of the intrinsic functions that :meth:`map_call` evaluates,
+    keyed by lower-case name. Additional arguments, e.g., ``kind``, are ignored.
+    """
+
     def map_call(self, expr):
-        if expr.function.name.lower() == 'min':
-            return min(self.rec(par) for par in expr.parameters)
-        if expr.function.name.lower() == 'max':
-            return max(self.rec(par) for par in expr.parameters)
-        if expr.function.name.lower() == 'modulo':
-            args = [self.rec(par) for par in expr.parameters]
-            return args[0]%args[1]
-        if expr.function.name.lower() == 'abs':
-            return abs(float([self.rec(par) for par in expr.parameters][0]))
-        if expr.function.name.lower() == 'int':
-            return int(float([self.rec(par) for par in expr.parameters][0]))
-        if expr.function.name.lower() == 'real':
-            return float([self.rec(par) for par in expr.parameters][0])
-        if expr.function.name.lower() == 'sqrt':
-            return math.sqrt(float([self.rec(par) for par in expr.parameters][0]))
-        if expr.function.name.lower() == 'exp':
-            return math.exp(float([self.rec(par) for par in expr.parameters][0]))
+        intrinsic = self._intrinsic_functions.get(expr.function.name.lower())
+        if intrinsic is not None:
+            return intrinsic(*[self.rec(par) for par in expr.parameters])
         if expr.function.name in self.context and not callable(self.context[expr.function.name]):
             return self._evaluate_array(self.context[expr.function.name],
                     [self.rec(par) for par in expr.parameters])
@@ -386,14 +390,25 @@ class ExpressionParser(ParserBase):
     Extend :any:`pymbolic.parser.Parser.lex_table` to accomodate for Fortran specifix syntax/expressions.
     """
 
-    ParserBase._COMP_TABLE.update({
+    _COMP_TABLE = {
+         **ParserBase._COMP_TABLE,
          _f_lessequal: "<=",
          _f_less: "<",
          _f_greaterequal: ">=",
          _f_greater: ">",
          _f_equal: "==",
          _f_notequal: "!="
-         })
+         }
+    """
+    Extend :any:`pymbolic.parser.Parser._COMP_TABLE` with the Fortran-style comparison operators.
+    """
+
+    _to_loki = PymbolicMapper()
+    _attach_scopes = AttachScopes()
+    """
+    The mapper and visitor that :meth:`__call__` applies to every parse result.
+    Both hold no state between calls and are therefore shared.
+    """
 
     @staticmethod
     def _parenthesise(expr):
@@ -519,13 +534,37 @@ class ExpressionParser(ParserBase):
         :any:`Expression`
             The expression tree corresponding to the expression
         """
-        result = super().__call__(expr_str)
+        result = self._parse(expr_str)
         context = context or {}
         context = CaseInsensitiveDict(context)
         if evaluate:
             result = LokiEvaluationMapper(context=context, strict=strict)(result)
-        ir = PymbolicMapper()(result)
-        return AttachScopes().visit(ir, scope=scope or Scope())
+        ir = self._to_loki(result)
+        return self._attach_scopes.visit(ir, scope=scope or Scope())
+
+    _plain_identifier = re.compile(r"(?!(?:and|or|not|if|else)\Z|True|False)[a-zA-Z_][a-zA-Z_0-9]*\Z")
+    """
+    Names that pymbolic's lexer would turn into a single identifier token
+    """
+
+    @lru_cache(maxsize=4096)
+    def _parse(self, expr_str):
+        """
+        Run pymbolic's lexer and parser on :data:`expr_str`.
+
+        The resulting pymbolic expression tree depends only on the string and is
+        never modified, which allows to cache it. Scope and context dependent
+        steps (evaluation, mapping to Loki expressions and attaching scopes)
+        are repeated for every call to :meth:`__call__`.
+
+        Plain names and unsigned integers bypass the lexer and are constructed
+        directly as the terminal that pymbolic would produce for them.
+        """
+        if self._plain_identifier.match(expr_str):
+            return pmbl.Variable(expr_str)
+        if expr_str.isascii() and expr_str.isdigit():
+            return int(expr_str)
+        return super().__call__(expr_str)
 
     def parse_float(self, s):
         """
@@ -12,6 +12,7 @@ Expression tree node classes for
 :ref:`internal_representation:Expression tree`.
 """
 
+from functools import lru_cache
 from itertools import chain
 import weakref
 from sys import intern
@@ -45,16 +46,28 @@ __all__ = [
 
 # pylint: disable=abstract-method,too-many-lines
 
+@lru_cache(maxsize=None)
+def _loki_stringifier():
+    """
+    Create the :any:`LokiStringifyMapper` instance that is shared by all
+    expression nodes
+    """
+    from loki.expression.mappers import LokiStringifyMapper  # pylint: disable=import-outside-toplevel
+    return LokiStringifyMapper()
+
+
 def loki_make_stringifier(self, originating_stringifier=None):  # pylint: disable=unused-argument
     """
     Return a :any:`LokiStringifyMapper` instance that can be used to generate a
     human-readable representation of :data:`self`.
 
     This is used as common abstraction for the :meth:`make_stringifier` method in
-    Pymbolic expression nodes.
+    Pymbolic expression nodes. The mapper does not hold any state between calls,
+    so a single instance is created on first use and re-used afterwards. This
+    speeds up the frequent conversions to string, e.g., in comparisons of
+    expressions to strings via :any:`StrCompareMixin`.
     """
-    from loki.expression.mappers import LokiStringifyMapper  # pylint: disable=import-outside-toplevel
-    return LokiStringifyMapper()
+    return _loki_stringifier()
 
 
 class StrCompareMixin:
@@ -6,8 +6,7 @@
 # nor does it submit to any jurisdiction.
 
 from collections import defaultdict
-from pathlib import Path
-import math
+from functools import lru_cache
 import sys
 import pytest
 import numpy as np
@@ -20,7 +19,7 @@ from loki import (
     SymbolAttributes, DerivedType, ProcedureType
 )
 from loki.backend import cgen, fgen
-from loki.build import jit_compile, clean_test
+from loki.build import jit_compile
 from loki.expression import (
     symbols as sym, FindVariables, FindExpressions, FindTypedSymbols,
     FindInlineCalls, SubstituteExpressions, AttachScopesMapper, parse_expr
@@ -30,23 +29,167 @@ from loki.frontend import (
 )
 from loki.ir import nodes as ir, FindNodes
 from loki.tools import (
-    gettempdir, filehash, stdchannel_redirected, stdchannel_is_captured
+    gettempdir, filehash, stdchannel_captured, stdchannel_is_captured
 )
 
 # pylint: disable=too-many-lines
 
 
-@pytest.fixture(scope='module', name='here')
-def fixture_here():
-    return Path(__file__).parent
+_parse_cache = {}
 
+_shared_parse_keys = set()
+""" Keys of cached program units that the current test received without cloning """
 
-@pytest.mark.parametrize('frontend', available_frontends())
-def test_arithmetic(here, frontend):
+
+def _cached_program_unit(cls, fcode, frontend, clone=True):
     """
-    Test simple floating point arithmetic expressions (+,-,*,/,**).
+    Parse :data:`fcode` into a :data:`cls` object with :data:`frontend` only
+    once per test module
+
+    The cached :any:`ProgramUnit` is returned as a clone, unless :data:`clone`
+    is `False`, which is allowed only for tests that do not modify the IR.
+    This is enforced by :meth:`fixture_check_shared_program_units`.
     """
-    fcode = """
+    key = (cls, fcode, str(frontend))
+    if key not in _parse_cache:
+        unit = cls.from_source(fcode, frontend=frontend)
+        _parse_cache[key] = (unit, fgen(unit))
+    if clone:
+        return _parse_cache[key][0].clone()
+    _shared_parse_keys.add(key)
+    return _parse_cache[key][0]
+
+
+def _cached_subroutine(fcode, frontend, clone=True):
+    """
+    Parse :data:`fcode` into a :any:`Subroutine` via :meth:`_cached_program_unit`
+    """
+    return _cached_program_unit(Subroutine, fcode, frontend, clone=clone)
+
+
+def _cached_module(fcode, frontend, clone=True):
+    """
+    Parse :data:`fcode` into a :any:`Module` via :meth:`_cached_program_unit`
+    """
+    return _cached_program_unit(Module, fcode, frontend, clone=clone)
+
+
+_jit_cache = {}
+
+
+def _jit_compile_cached(source, objname=None):
+    """
+    JIT-compile :data:`source` only once per unique generated Fortran code
+
+    The build is keyed on a hash of the generated code and placed in
+    :any:`gettempdir`, so that identical code from different frontends
+    re-uses the already loaded module instead of invoking the compiler again.
+    Returns the routine :data:`objname` or, if not given, the whole module.
+    """
+    fcode = fgen(source)
+    prefix = f'{objname}_' if objname else 'expression_'
+    filepath = gettempdir()/filehash(fcode, prefix=prefix, suffix='.f90')
+    if filepath not in _jit_cache:
+        _jit_cache[filepath] = jit_compile(fcode, filepath=filepath)
+    if objname:
+        return getattr(_jit_cache[filepath], objname)
+    return _jit_cache[filepath]
+
+
+_find_cache = {}
+
+_FIND_VARIABLES = FindVariables()
+""" A shared :any:`FindVariables` instance, as expression finders can be re-used """
+
+
+def _find_nodes(node, node_type):
+    """
+    Cached :any:`FindNodes` lookup of :data:`node_type` in :data:`node`
+
+    Results are keyed on the identity of :data:`node` and must therefore only be
+    used for IR that is not modified afterwards. The cache holds a reference to
+    :data:`node` to keep that identity unique.
+    """
+    key = (id(node), FindNodes, node_type)
+    if key not in _find_cache:
+        _find_cache[key] = (node, tuple(FindNodes(node_type).visit(node)))
+    return _find_cache[key][1]
+
+
+def _find_variables(node):
+    """
+    Cached :any:`FindVariables` lookup in :data:`node`, see :meth:`_find_nodes`
+    """
+    key = (id(node), FindVariables)
+    if key not in _find_cache:
+        _find_cache[key] = (node, _FIND_VARIABLES.visit(node))
+    return _find_cache[key][1]
+
+
+@pytest.fixture(scope='session', name='frontend', params=available_frontends())
+def fixture_frontend(request):
+    """
+    Default frontend parametrization for all tests without frontend-specific
+    skip or xfail markers
+    """
+    return request.param
+
+
+@pytest.fixture(autouse=True, name='check_shared_program_units')
+def fixture_check_shared_program_units():
+    """
+    Verify that tests do not modify program units that they received from
+    :meth:`_cached_program_unit` with ``clone=False``
+
+    A modified program unit is dropped from the cache, so that it does not
+    affect other tests.
+    """
+    yield
+    modified = []
+    while _shared_parse_keys:
+        key = _shared_parse_keys.pop()
+        unit, ref = _parse_cache[key]
+        if fgen(unit) != ref:
+            del _parse_cache[key]
+            modified += [unit.name]
+    assert not modified, f'Program units retrieved with clone=False were modified: {modified}'
+
+
+@pytest.fixture(name='scope')
+def fixture_scope():
+    """
+    A fresh :any:`Scope` for tests that construct expressions manually
+    """
+    return Scope()
+
+
+@pytest.fixture(scope='module', name='kitchen_sink')
+def fixture_kitchen_sink(frontend):
+    """
+    Compile the sources of all tests that only call a JIT-compiled routine
+    with scalar arguments into a single module, once per frontend
+
+    When running with ``pytest -n <N> --dist loadgroup``, all users of this
+    fixture are scheduled onto the same worker, which avoids compiling the
+    module on every worker.
+    """
+    fcode = '\n'.join((
+        _FCODE_ARITHMETIC,
+        _FCODE_MATH_INTRINSICS,
+        _FCODE_LOGICALS,
+        _FCODE_LITERALS,
+        _FCODE_BOZ_LITERALS,
+        _FCODE_CASTS,
+        _FCODE_VERY_LONG_STATEMENT,
+        _FCODE_CHARACTER_CONCAT,
+        _FCODE_PARAMETER_STMT,
+        _FCODE_POINTER_NULLIFY
+    ))
+    source = Sourcefile.from_source(fcode, frontend=frontend)
+    return _jit_compile_cached(source)
+
+
+_FCODE_ARITHMETIC = """
 subroutine arithmetic_expr(v1, v2, v3, v4, v5, v6)
   integer, parameter :: jprb = selected_real_kind(13,300)
   real(kind=jprb), intent(in) :: v1, v2, v3, v4
@@ -56,21 +199,9 @@ subroutine arithmetic_expr(v1, v2, v3, v4, v5, v6)
   v6 = (v1 ** v2) - (v3 / v4)
 end subroutine arithmetic_expr
 """
-    filepath = here/(f'expression_arithmetic_{frontend}.f90')
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    function = jit_compile(routine, filepath=filepath, objname='arithmetic_expr')
 
-    v5, v6 = function(2., 3., 10., 5.)
-    assert v5 == 25. and v6 == 6.
-    clean_test(filepath)
 
-
-@pytest.mark.parametrize('frontend', available_frontends())
-def test_math_intrinsics(here, frontend):
-    """
-    Test supported math intrinsic functions (min, max, exp, abs, sqrt, log)
-    """
-    fcode = """
+_FCODE_MATH_INTRINSICS = """
 subroutine math_intrinsics(v1, v2, vmin, vmax, vabs, vexp, vsqrt, vlog)
   integer, parameter :: jprb = selected_real_kind(13,300)
   real(kind=jprb), intent(in) :: v1, v2
@@ -84,22 +215,9 @@ subroutine math_intrinsics(v1, v2, vmin, vmax, vabs, vexp, vsqrt, vlog)
   vlog = log(v1 + v2)
 end subroutine math_intrinsics
 """
-    filepath = here/(f'expression_math_intrinsics_{frontend}.f90')
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    function = jit_compile(routine, filepath=filepath, objname='math_intrinsics')
-
-    vmin, vmax, vabs, vexp, vsqrt, vlog = function(2., 4.)
-    assert vmin == 2. and vmax == 4. and vabs == 2.
-    assert vexp == np.exp(6.) and vsqrt == np.sqrt(6.) and vlog == np.log(6.)
-    clean_test(filepath)
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
-def test_logicals(here, frontend):
-    """
-    Test logical expressions (and, or, not, tru, false, equal, not nequal).
-    """
-    fcode = """
+_FCODE_LOGICALS = """
 subroutine logicals(t, f, vand_t, vand_f, vor_t, vor_f, vnot_t, vnot_f, vtrue, vfalse, veq, vneq)
   logical, intent(in) :: t, f
   logical, intent(out) :: vand_t, vand_f, vor_t, vor_f, vnot_t, vnot_f, vtrue, vfalse, veq, vneq
@@ -116,22 +234,101 @@ subroutine logicals(t, f, vand_t, vand_f, vor_t, vor_f, vnot_t, vnot_f, vtrue, v
   vneq = 3 /= 4
 end subroutine logicals
 """
-    filepath = here/(f'expression_logicals_{frontend}.f90')
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    function = jit_compile(routine, filepath=filepath, objname='logicals')
 
-    vand_t, vand_f, vor_t, vor_f, vnot_t, vnot_f, vtrue, vfalse, veq, vneq = function(True, False)
-    assert vand_t and vor_t and vnot_t and vtrue and vneq
-    assert not(vand_f and vor_f and vnot_f and vfalse and veq)
-    clean_test(filepath)
 
+_FCODE_CASTS = """
+subroutine casts(v1, v2, v3, v4, v5)
+  integer, parameter :: jprb = selected_real_kind(13,300)
+  integer, intent(in) :: v1
+  real(kind=jprb), intent(in) :: v2, v3
+  real(kind=jprb), intent(out) :: v4, v5
+
+  v4 = real(v1, kind=jprb)  ! Test a plain cast
+  v5 = real(v1, kind=jprb) * max(v2, v3)  ! Cast as part of expression
+end subroutine casts
+"""
+
+
+_FCODE_VERY_LONG_STATEMENT = """
+subroutine very_long_statement(scalar, res)
+  integer, intent(in) :: scalar
+  integer, intent(out) :: res
+
+  res = 5 * scalar + scalar - scalar + scalar - scalar + (scalar - scalar &
+      & + scalar - scalar) - 1 + 2 - 3 + 4 - 5 + 6 - 7 + 8 - (9 + 10      &
+        - 9) + 10 - 8 + 7 - 6 + 5 - 4 + 3 - 2 + 1
+end subroutine very_long_statement
+"""
+
+
+_FCODE_CHARACTER_CONCAT = """
+subroutine character_concat(string)
+  character(10) :: tmp_str1, tmp_str2
+  character(len=12), intent(out) :: string
+
+  tmp_str1 = "Hel" // "lo"
+  tmp_str2 = "wor" // "l" // "d"
+  string = trim(tmp_str1) // " " // trim(tmp_str2)
+  string = trim(string) // "!"
+end subroutine character_concat
+"""
 
-@pytest.mark.parametrize('frontend', available_frontends())
-def test_literals(here, frontend):
+
+_FCODE_PARAMETER_STMT = """
+subroutine parameter_stmt(out1)
+  implicit none
+  integer, parameter :: jprb = selected_real_kind(13,300)
+  real(kind=jprb) :: param
+  parameter(param=2.0)
+  real(kind=jprb), intent(out) :: out1
+
+  out1 = param
+end subroutine parameter_stmt
+"""
+
+
+@pytest.mark.xdist_group('expression_kitchen_sink')
+@pytest.mark.parametrize('name,args,expected', [
+    # Simple floating point arithmetic expressions (+,-,*,/,**)
+    pytest.param('arithmetic_expr', (2., 3., 10., 5.), (25., 6.), id='arithmetic'),
+    # Supported math intrinsic functions (min, max, exp, abs, sqrt, log)
+    pytest.param(
+        'math_intrinsics', (2., 4.), (2., 4., 2., np.exp(6.), np.sqrt(6.), np.log(6.)),
+        id='math_intrinsics'
+    ),
+    # Logical expressions (and, or, not, true, false, equal, not equal)
+    pytest.param(
+        'logicals', (True, False),
+        (True, False, True, False, True, False, True, False, False, True),
+        id='logicals'
+    ),
+    # Simple literal values
+    pytest.param(
+        'literals', (), (66., 66., pytest.approx(2.3, abs=1.e-6), 2.4, 7., 3.),
+        id='literals'
+    ),
+    # BOZ literal values
+    pytest.param('boz_literals', (), (0, 42, 479, 7, 51966, 47806), id='boz_literals'),
+    # Data type casting expressions
+    pytest.param('casts', (2, 1., 4.), (2., 8.), id='casts'),
+    # A long statement with line breaks
+    pytest.param('very_long_statement', (1,), 5, id='very_long_statement'),
+    # Concatenation operator ``//``
+    pytest.param('character_concat', (), b'Hello world!', id='character_concat'),
+    # PARAMETER(...) statement
+    pytest.param('parameter_stmt', (), 2.0, id='parameter_stmt'),
+    # POINTERS and their nullification via '=> NULL()'
+    pytest.param('pointer_nullify', (), None, id='pointer_nullify'),
+])
+def test_scalar_subroutine(kitchen_sink, name, args, expected):
     """
-    Test simple literal values.
+    Test the results of routines with only scalar arguments.
     """
-    fcode = """
+    function = getattr(kitchen_sink, name)
+    assert function(*args) == expected
+
+
+_FCODE_LITERALS = """
 subroutine literals(v1, v2, v3, v4, v5, v6)
   integer, parameter :: jprb = selected_real_kind(13,300)
   real(kind=jprb), intent(out) :: v1, v2, v3
@@ -146,18 +343,15 @@ subroutine literals(v1, v2, v3, v4, v5, v6)
   v6 = int(3.5)
 end subroutine literals
 """
-    filepath = here/(f'expression_literals_{frontend}.f90')
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    function = jit_compile(routine, filepath=filepath, objname='literals')
-
-    v1, v2, v3, v4, v5, v6 = function()
-    assert v1 == 66. and v2 == 66. and v4 == 2.4 and v5 == 7.0 and v6 == 3.0
-    assert math.isclose(v3, 2.3, abs_tol=1.e-6)
-    clean_test(filepath)
-
-    # In addition to value testing, let's make sure
-    # that we created the correct expression types
-    stmts = FindNodes(ir.Assignment).visit(routine.body)
+
+
+def test_literals(frontend):
+    """
+    Test the expression types of simple literal values.
+    """
+    routine = _cached_subroutine(_FCODE_LITERALS, frontend, clone=False)
+
+    stmts = _find_nodes(routine.body, ir.Assignment)
     assert isinstance(stmts[0].rhs, sym.IntLiteral)
     assert isinstance(stmts[1].rhs, sym.FloatLiteral)
     assert isinstance(stmts[2].rhs, sym.FloatLiteral)
@@ -172,12 +366,7 @@ end subroutine literals
     assert isinstance(stmts[6].rhs, sym.Cast)
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
-def test_boz_literals(here, frontend):
-    """
-    Test boz literal values.
-    """
-    fcode = """
+_FCODE_BOZ_LITERALS = """
 subroutine boz_literals(n1, n2, n3, n4, n5, n6)
   integer, intent(out) :: n1, n2, n3, n4, n5, n6
 
@@ -189,19 +378,18 @@ subroutine boz_literals(n1, n2, n3, n4, n5, n6)
   n6 = int(z"babe")
 end subroutine boz_literals
 """
-    filepath = here/(f'expression_boz_literals_{frontend}.f90')
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    function = jit_compile(routine, filepath=filepath, objname='boz_literals')
 
-    n1, n2, n3, n4, n5, n6 = function()
-    clean_test(filepath)
-    assert n1 == 0 and n2 == 42 and n3 == 479 and n4 == 7 and n5 == 51966 and n6 == 47806
 
-    # In addition to value testing, let's make sure that we created the correct expression types
+def test_boz_literals(frontend):
+    """
+    Test the expression types of boz literal values.
+    """
+    routine = _cached_subroutine(_FCODE_BOZ_LITERALS, frontend, clone=False)
+
     if frontend is not OMNI:
         # Note: Omni evaluates BOZ constants, so it creates IntegerLiteral instead...
         # Note: FP converts constants to upper case
-        stmts = FindNodes(ir.Assignment).visit(routine.body)
+        stmts = _find_nodes(routine.body, ir.Assignment)
 
         for stmt in stmts:
             assert isinstance(stmt.rhs.parameters[0], sym.IntrinsicLiteral)
@@ -217,7 +405,7 @@ end subroutine boz_literals
 @pytest.mark.parametrize('frontend', available_frontends(
     skip={OFP: "Not implemented because too stupid in OFP parse tree"})
 )
-def test_complex_literals(here, frontend):
+def test_complex_literals(frontend):
     """
     Test complex literal values.
     """
@@ -230,16 +418,14 @@ subroutine complex_literals(c1, c2, c3)
   c3 = (21_2, 4._8)
 end subroutine complex_literals
 """
-    filepath = here/(f'expression_complex_literals_{frontend}.f90')
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    function = jit_compile(routine, filepath=filepath, objname='complex_literals')
+    routine = _cached_subroutine(fcode, frontend)
+    function = _jit_compile_cached(routine, objname='complex_literals')
 
     c1, c2, c3 = function()
-    clean_test(filepath)
     assert c1 == (1-1j) and c2 == (3+2e8j) and c3 == (21+4j)
 
     # In addition to value testing, let's make sure that we created the correct expression types
-    stmts = FindNodes(ir.Assignment).visit(routine.body)
+    stmts = _find_nodes(routine.body, ir.Assignment)
     assert isinstance(stmts[0].rhs, sym.IntrinsicLiteral) and stmts[0].rhs.value == '(1.0, -1.0)'
     # Note: Here, for inconsistency, FP converts the exponential letter 'e' to lower case...
     assert isinstance(stmts[1].rhs, sym.IntrinsicLiteral) and stmts[1].rhs.value.lower() == '(3, 2e8)'
@@ -252,33 +438,15 @@ end subroutine complex_literals
         raise excinfo
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
-def test_casts(here, frontend):
+def _ref_logical_array(arr):
     """
-    Test data type casting expressions.
+    Reference solution for :meth:`test_logical_array`
     """
-    fcode = """
-subroutine casts(v1, v2, v3, v4, v5)
-  integer, parameter :: jprb = selected_real_kind(13,300)
-  integer, intent(in) :: v1
-  real(kind=jprb), intent(in) :: v2, v3
-  real(kind=jprb), intent(out) :: v4, v5
-
-  v4 = real(v1, kind=jprb)  ! Test a plain cast
-  v5 = real(v1, kind=jprb) * max(v2, v3)  ! Cast as part of expression
-end subroutine casts
-"""
-    filepath = here/(f'expression_casts_{frontend}.f90')
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    function = jit_compile(routine, filepath=filepath, objname='casts')
+    mask = np.arange(arr.size) >= 2
+    return np.where(mask & (arr > 1.), 3., 1.)
 
-    v4, v5 = function(2, 1., 4.)
-    assert v4 == 2. and v5 == 8.
-    clean_test(filepath)
 
-
-@pytest.mark.parametrize('frontend', available_frontends())
-def test_logical_array(here, frontend):
+def test_logical_array(frontend):
     """
     Test logical arrays for masking.
     """
@@ -306,20 +474,20 @@ subroutine logical_array(dim, arr, out)
   end do
 end subroutine logical_array
 """
-    filepath = here/(f'expression_logical_array_{frontend}.f90')
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    function = jit_compile(routine, filepath=filepath, objname='logical_array')
+    routine = _cached_subroutine(fcode, frontend)
+    function = _jit_compile_cached(routine, objname='logical_array')
 
-    out = np.zeros(6)
-    function(6, [0., 2., -1., 3., 0., 2.], out)
-    assert (out == [1., 1., 1., 3., 1., 3.]).all()
-    clean_test(filepath)
+    arr = np.array([0., 2., -1., 3., 0., 2.])
+    ref = _ref_logical_array(arr)
+    out = np.empty(6, dtype=np.float64)
+    function(6, arr, out)
+    assert np.array_equal(out, ref)
 
 
 @pytest.mark.parametrize('frontend', available_frontends(
     xfail=[(OFP, 'Not implemented')]
 ))
-def test_array_constructor(here, frontend):
+def test_array_constructor(frontend):
     """
     Test various array constructor formats
     """
@@ -346,9 +514,8 @@ subroutine array_constructor(dim, zarr1, zarr2, narr1, narr2, narr3, narr4, narr
 end subroutine array_constructor
     """.strip()
 
-    filepath = here/f'array_constructor_{frontend}.f90'
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    function = jit_compile(routine, filepath=filepath, objname='array_constructor')
+    routine = _cached_subroutine(fcode, frontend)
+    function = _jit_compile_cached(routine, objname='array_constructor')
 
     literal_lists = [e for e in FindExpressions().visit(routine.body) if isinstance(e, sym.LiteralList)]
     assert len(literal_lists) == 8
@@ -364,24 +531,23 @@ end subroutine array_constructor
     }
 
     dim = 13
-    zarr1 = np.zeros(dim+1, dtype=np.float64)
-    zarr2 = np.zeros(3, dtype=np.float64)
-    narr1 = np.zeros(dim, dtype=np.int32)
-    narr2 = np.zeros(10, dtype=np.int32)
-    narr3 = np.zeros(3, dtype=np.int32)
-    narr4 = np.zeros((2, 2), dtype=np.int32, order='F')
-    narr5 = np.zeros(10, dtype=np.int32)
+    zarr1 = np.empty(dim+1, dtype=np.float64)
+    zarr2 = np.empty(3, dtype=np.float64)
+    narr1 = np.empty(dim, dtype=np.int32)
+    narr2 = np.empty(10, dtype=np.int32)
+    narr3 = np.empty(3, dtype=np.int32)
+    narr4 = np.empty((2, 2), dtype=np.int32, order='F')
+    narr5 = np.empty(10, dtype=np.int32)
     function(dim, zarr1, zarr2, narr1, narr2, narr3, narr4, narr5)
 
-    assert np.isclose(zarr1, ([3.6] + [3.6/(i+1) for i in range(dim)])).all()
-    assert np.isclose(zarr2, [1., 2., 3.]).all()
-    assert (narr1 == range(1, dim+1)).all()
-    assert (narr2 == range(1, -9, -1)).all()
-    assert (narr3 == [1, 2, 3]).all()
-    assert (narr4 == np.array([[1, 3], [2, 4]], order='F')).all()
-    assert (narr5 == range(30, 49, 2)).all()
-
-    clean_test(filepath)
+    ref_zarr1 = np.append(3.6, 3.6 / np.arange(1, dim+1, dtype=np.float64))
+    assert np.allclose(zarr1, ref_zarr1)
+    assert np.allclose(zarr2, np.array([1., 2., 3.]))
+    assert np.array_equal(narr1, np.arange(1, dim+1, dtype=np.int32))
+    assert np.array_equal(narr2, np.arange(1, -9, -1, dtype=np.int32))
+    assert np.array_equal(narr3, np.array([1, 2, 3], dtype=np.int32))
+    assert np.array_equal(narr4, np.array([[1, 3], [2, 4]], dtype=np.int32, order='F'))
+    assert np.array_equal(narr5, np.arange(30, 49, 2, dtype=np.int32))
 
 
 @pytest.mark.parametrize('frontend', available_frontends(xfail=[(OMNI, 'Precedence not honoured')]))
@@ -414,8 +580,8 @@ subroutine parenthesis(v1, v2, v3, i)
   v3 = v1(i)*(1.0_jprb / (v2*v3))
 end subroutine parenthesis
 """.strip()
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    stmts = FindNodes(ir.Assignment).visit(routine.body)
+    routine = _cached_subroutine(fcode, frontend, clone=False)
+    stmts = _find_nodes(routine.body, ir.Assignment)
 
     # Check that the reduntant bracket around the minus
     # and the first exponential are still there.
@@ -423,7 +589,7 @@ end subroutine parenthesis
 
     # Now perform a simple substitutions on the expression
     # and make sure we are still parenthesising as we should!
-    v2 = [v for v in FindVariables().visit(stmts[0]) if v.name == 'v2'][0]
+    v2 = [v for v in _FIND_VARIABLES.visit(stmts[0]) if v.name == 'v2'][0]
     v4 = v2.clone(name='v4')
     stmt2 = SubstituteExpressions({v2: v4}).visit(stmts[0])
     assert fgen(stmt2) == 'v3 = (v1(i - 1)**1.23_jprb)*1.3_jprb + (1_jprb - v4**1.26_jprb)'
@@ -433,7 +599,6 @@ end subroutine parenthesis
     assert fgen(stmts[2]) == fcode.splitlines()[-2].lstrip()
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
 def test_commutativity(frontend):
     """
     Verifies the strict adherence to ordering of commutative terms,
@@ -448,14 +613,13 @@ subroutine commutativity(v1, v2, v3)
   v3(:) = 1._jprb + v2*v1(:) - v2 - v3(:)
 end subroutine commutativity
 """
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    stmt = FindNodes(ir.Assignment).visit(routine.body)[0]
+    routine = _cached_subroutine(fcode, frontend, clone=False)
+    stmt = _find_nodes(routine.body, ir.Assignment)[0]
 
     assert fgen(stmt) in ('v3(:) = 1.0_jprb + v2*v1(:) - v2 - v3(:)',
                           'v3(:) = 1._jprb + v2*v1(:) - v2 - v3(:)')
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
 def test_index_ranges(frontend):
     """
     Test index range expressions for array accesses.
@@ -470,7 +634,7 @@ subroutine index_ranges(dim, v1, v2, v3, v4, v5)
   v5(:) = v2(1:dim)*v1(::2) - v3(0:4:2)
 end subroutine index_ranges
 """
-    routine = Subroutine.from_source(fcode, frontend=frontend)
+    routine = _cached_subroutine(fcode, frontend, clone=False)
     vmap = routine.variable_map
 
     assert str(vmap['v1']) == 'v1(:)'
@@ -481,15 +645,14 @@ end subroutine index_ranges
     assert str(vmap['v4']) == 'v4(dim)' or str(vmap['v4']) == 'v4(1:dim)'
     assert str(vmap['v5']) == 'v5(1:dim)'
 
-    vmap_body = {v.name: v for v in FindVariables().visit(routine.body)}
+    vmap_body = {v.name: v for v in _find_variables(routine.body)}
     assert str(vmap_body['v1']) == 'v1(::2)'
     assert str(vmap_body['v2']) == 'v2(1:dim)'
     assert str(vmap_body['v3']) == 'v3(0:4:2)'
     assert str(vmap_body['v5']) == 'v5(:)'
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
-def test_strings(here, frontend, capsys):
+def test_strings(frontend, capsys):
     """
     Test recognition of literal strings.
     """
@@ -504,49 +667,16 @@ subroutine strings()
   print *, "42!"
 end subroutine strings
 """
-    filepath = here/(f'expression_strings_{frontend}.f90')
-    routine = Subroutine.from_source(fcode, frontend=frontend)
+    routine = _cached_subroutine(fcode, frontend)
 
-    function = jit_compile(routine, filepath=filepath, objname='strings')
-    output_file = gettempdir()/filehash(str(filepath), prefix='', suffix='.log')
+    function = _jit_compile_cached(routine, objname='strings')
     with capsys.disabled():
-        with stdchannel_redirected(sys.stdout, output_file):
+        with stdchannel_captured(sys.stdout) as output:
             function()
 
-    clean_test(filepath)
-
-    with open(output_file, 'r') as f:
-        output_str = f.read()
-
-    assert output_str == ' Hello world!\n 42!\n'
-
-
-@pytest.mark.parametrize('frontend', available_frontends())
-def test_very_long_statement(here, frontend):
-    """
-    Test a long statement with line breaks.
-    """
-    fcode = """
-subroutine very_long_statement(scalar, res)
-  integer, intent(in) :: scalar
-  integer, intent(out) :: res
-
-  res = 5 * scalar + scalar - scalar + scalar - scalar + (scalar - scalar &
-      & + scalar - scalar) - 1 + 2 - 3 + 4 - 5 + 6 - 7 + 8 - (9 + 10      &
-        - 9) + 10 - 8 + 7 - 6 + 5 - 4 + 3 - 2 + 1
-end subroutine very_long_statement
-"""
-    filepath = here/(f'expression_very_long_statement_{frontend}.f90')
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    function = jit_compile(routine, filepath=filepath, objname='very_long_statement')
-
-    scalar = 1
-    result = function(scalar)
-    assert result == 5
-    clean_test(filepath)
+    assert output.getvalue() == ' Hello world!\n 42!\n'
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
 def test_output_intrinsics(frontend):
     """
     Some collected intrinsics or other edge cases that failed in cloudsc.
@@ -565,7 +695,7 @@ subroutine output_intrinsics
      write(0, 1002) numomp, ngptot, - 1, int(tdiff * 1000.0_jprb)
 end subroutine output_intrinsics
 """
-    routine = Subroutine.from_source(fcode, frontend=frontend)
+    routine = _cached_subroutine(fcode, frontend, clone=False)
 
     ref = ['format(1x, 2i10, 1x, i4, \' : \', i10)',
            'write(0, 1002) numomp, ngptot, - 1, int(tdiff * 1000.0_jprb)']
@@ -576,15 +706,14 @@ end subroutine output_intrinsics
         ref[1] = ref[1].replace(' * ', '*')
         ref[1] = ref[1].replace('- 1', '-1')
 
-    intrinsics = FindNodes(ir.Intrinsic).visit(routine.body)
+    intrinsics = _find_nodes(routine.body, ir.Intrinsic)
     assert len(intrinsics) == 2
     assert intrinsics[0].text.lower() == ref[0]
     assert intrinsics[1].text.lower() == ref[1]
     assert fgen(intrinsics).lower() == '{} {}\n{}'.format('1002', *ref)
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
-def test_nested_call_inline_call(here, frontend):
+def test_nested_call_inline_call(frontend):
     """
     The purpose of this test is to highlight the differences between calls in expression
     (such as `InlineCall`, `Cast`) and call nodes in the IR.
@@ -622,17 +751,14 @@ subroutine nested_call_inline_call(v1, v2, v3)
   call very_long_statement(int(v2), v3)
 end subroutine nested_call_inline_call
 """
-    filepath = here/(f'expression_nested_call_inline_call_{frontend}.f90')
     routine = Sourcefile.from_source(fcode, frontend=frontend)
-    function = jit_compile(routine, filepath=filepath, objname='nested_call_inline_call')
+    function = _jit_compile_cached(routine, objname='nested_call_inline_call')
 
     v2, v3 = function(1)
     assert v2 == 8.
     assert v3 == 40
-    clean_test(filepath)
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
 def test_no_arg_inline_call(frontend):
     """
     Make sure that no-argument function calls are recognized as such,
@@ -659,9 +785,9 @@ end subroutine my_routine
     """
 
     if frontend != OMNI:
-        routine = Subroutine.from_source(fcode_routine, frontend=frontend)
+        routine = _cached_subroutine(fcode_routine, frontend, clone=False)
         assert routine.symbol_attrs['my_func'].dtype is BasicType.DEFERRED
-        assignment = FindNodes(ir.Assignment).visit(routine.body)[0]
+        assignment = _find_nodes(routine.body, ir.Assignment)[0]
         assert assignment.lhs == 'var'
         assert isinstance(assignment.rhs, sym.InlineCall)
         assert isinstance(assignment.rhs.function, sym.DeferredTypeSymbol)
@@ -669,13 +795,12 @@ end subroutine my_routine
     module = Module.from_source(fcode_mod, frontend=frontend)
     routine = Subroutine.from_source(fcode_routine, frontend=frontend, definitions=module)
     assert isinstance(routine.symbol_attrs['my_func'].dtype, ProcedureType)
-    assignment = FindNodes(ir.Assignment).visit(routine.body)[0]
+    assignment = _find_nodes(routine.body, ir.Assignment)[0]
     assert assignment.lhs == 'var'
     assert isinstance(assignment.rhs, sym.InlineCall)
     assert isinstance(assignment.rhs.function, sym.ProcedureSymbol)
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
 def test_inline_call_derived_type_arguments(frontend):
     """
     Check that derived type arguments are correctly represented in
@@ -729,33 +854,17 @@ end module inline_call_mod
     }
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
-def test_character_concat(here, frontend):
+def _ref_masked_statements(vec1, vec2, vec3):
     """
-    Concatenation operator ``//``
+    Reference solution for :meth:`test_masked_statements`
     """
-    fcode = """
-subroutine character_concat(string)
-  character(10) :: tmp_str1, tmp_str2
-  character(len=12), intent(out) :: string
-
-  tmp_str1 = "Hel" // "lo"
-  tmp_str2 = "wor" // "l" // "d"
-  string = trim(tmp_str1) // " " // trim(tmp_str2)
-  string = trim(string) // "!"
-end subroutine character_concat
-"""
-    filepath = here/(f'expression_character_concat_{frontend}.f90')
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    function = jit_compile(routine, filepath=filepath, objname='character_concat')
+    ref1 = np.where(vec1 > 5., 5., vec1)
+    ref2 = np.sign(vec2)
+    ref3 = np.where((0. < vec3) & (vec3 < 3.), 1., vec3)
+    return ref1, ref2, ref3
 
-    result = function()
-    assert result == b'Hello world!'
-    clean_test(filepath)
 
-
-@pytest.mark.parametrize('frontend', available_frontends())
-def test_masked_statements(here, frontend):
+def test_masked_statements(frontend):
     """
     Masked statements (WHERE(...) ... [ELSEWHERE ...] ENDWHERE)
     """
@@ -781,33 +890,31 @@ subroutine expression_masked_statements(length, vec1, vec2, vec3)
   where (0.0_jprb < vec3(:) .and. vec3(:) < 3.0_jprb) vec3(:) = 1.0_jprb
 end subroutine expression_masked_statements
 """
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    filepath = here/(f'{routine.name}_{frontend}.f90')
-    function = jit_compile(routine, filepath=filepath, objname=routine.name)
+    routine = _cached_subroutine(fcode, frontend)
+    function = _jit_compile_cached(routine, objname=routine.name)
 
-    # Reference solution
     length = 11
-    ref1 = np.append(np.arange(0, 6, dtype=np.float64),
-                     5 * np.ones(length - 6, dtype=np.float64))
-    ref2 = np.append(np.append(-1 *np.ones(5, dtype=np.float64), 0.0),
-                     np.ones(5, dtype=np.float64))
-    ref3 = np.append(np.arange(-2, 1, dtype=np.float64), np.ones(2, dtype=np.float64))
-    ref3 = np.append(ref3, np.arange(3, length - 2, dtype=np.float64))
-
     vec1 = np.arange(0, length, dtype=np.float64)
     vec2 = np.arange(-5, length - 5, dtype=np.float64)
     vec3 = np.arange(-2, length - 2, dtype=np.float64)
+    ref1, ref2, ref3 = _ref_masked_statements(vec1, vec2, vec3)
     function(length, vec1, vec2, vec3)
-    assert np.all(ref1 == vec1)
-    assert np.all(ref2 == vec2)
-    assert np.all(ref3 == vec3)
-    clean_test(filepath)
+    assert np.array_equal(ref1, vec1)
+    assert np.array_equal(ref2, vec2)
+    assert np.array_equal(ref3, vec3)
+
+
+def _ref_masked_statements_nested(vec1):
+    """
+    Reference solution for :meth:`test_masked_statements_nested`
+    """
+    return np.select([vec1 > 6., vec1 >= 4., vec1 < 2.], [6., 4., 0.], default=2.)
 
 
 @pytest.mark.parametrize('frontend', available_frontends(xfail=[
     (OFP, 'Current implementation does not handle nested where constructs')
 ]))
-def test_masked_statements_nested(here, frontend):
+def test_masked_statements_nested(frontend):
     """
     Nested masked statements (WHERE(...) ... [ELSEWHERE ...] ENDWHERE)
     """
@@ -832,27 +939,20 @@ subroutine expression_nested_masked_statements(length, vec1)
     endwhere
 end subroutine expression_nested_masked_statements
 """
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    filepath = here/(f'{routine.name}_{frontend}.f90')
-    function = jit_compile(routine, filepath=filepath, objname=routine.name)
+    routine = _cached_subroutine(fcode, frontend)
+    function = _jit_compile_cached(routine, objname=routine.name)
 
-    # Reference solution
     length = 11
     vec1 = np.arange(0, length, dtype=np.float64)
-    ref1 = np.zeros(length, dtype=np.float64)
-    ref1[vec1 >= 4.0] = 4.0
-    ref1[vec1 > 6.0] = 6.0
-    ref1[vec1 < 4.0] = 2.0
-    ref1[vec1 < 2.0] = 0.0
+    ref1 = _ref_masked_statements_nested(vec1)
     function(length, vec1)
-    assert np.all(ref1 == vec1)
-    clean_test(filepath)
+    assert np.array_equal(ref1, vec1)
 
 
 @pytest.mark.parametrize('frontend', available_frontends(xfail=[
     (OMNI, 'Not implemented'), (FP, 'Not implemented')
 ]))
-def test_data_declaration(here, frontend):
+def test_data_declaration(frontend):
     """
     Variable initialization with DATA statements
     """
@@ -874,24 +974,17 @@ subroutine data_declaration(data_out)
   data_out(1:3,1) = data3
 end subroutine data_declaration
 """
-    filepath = here/(f'expression_data_declaration_{frontend}.f90')
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    function = jit_compile(routine, filepath=filepath, objname='data_declaration')
+    routine = _cached_subroutine(fcode, frontend)
+    function = _jit_compile_cached(routine, objname='data_declaration')
 
     expected = np.ones(shape=(5, 4), dtype=np.int32, order='F') * 8
     expected[[0, 1, 2], 0] = [1, 3, 2]
-    result = np.zeros(shape=(5, 4), dtype=np.int32, order='F')
+    result = np.empty(shape=(5, 4), dtype=np.int32, order='F')
     function(result)
-    assert np.all(result == expected)
-    clean_test(filepath)
+    assert np.array_equal(result, expected)
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
-def test_pointer_nullify(here, frontend):
-    """
-    POINTERS and their nullification via '=> NULL()'
-    """
-    fcode = """
+_FCODE_POINTER_NULLIFY = """
 subroutine pointer_nullify()
   implicit none
   character(len=64), dimension(:), pointer :: charp => NULL()
@@ -905,49 +998,35 @@ subroutine pointer_nullify()
   charp => NULL()
 end subroutine pointer_nullify
 """
-    filepath = here/(f'expression_pointer_nullify_{frontend}.f90')
-    routine = Subroutine.from_source(fcode, frontend=frontend)
 
-    assert np.all(v.type.pointer for v in routine.variables)
-    assert np.all(isinstance(v.initial, sym.InlineCall) and v.type.initial.name.lower() == 'null'
-                  for v in routine.variables)
-    nullify_stmts = FindNodes(ir.Nullify).visit(routine.body)
+
+def test_pointer_nullify(frontend):
+    """
+    POINTERS and their nullification via '=> NULL()'
+
+    The generated code is compiled and executed in :meth:`test_scalar_subroutine`
+    to verify that it is valid Fortran.
+    """
+    routine = _cached_subroutine(_FCODE_POINTER_NULLIFY, frontend, clone=False)
+
+    assert all(v.type.pointer for v in routine.variables)
+    assert all(isinstance(v.initial, sym.InlineCall) and v.type.initial.name.lower() == 'null'
+               for v in routine.variables)
+    nullify_stmts = _find_nodes(routine.body, ir.Nullify)
     assert len(nullify_stmts) == 1
     assert nullify_stmts[0].variables[0].name == 'pp'
-    assert [stmt.ptr for stmt in FindNodes(ir.Assignment).visit(routine.body)].count(True) == 2
+    assert [stmt.ptr for stmt in _find_nodes(routine.body, ir.Assignment)].count(True) == 2
 
-    # Execute the generated identity (to verify it is valid Fortran)
-    function = jit_compile(routine, filepath=filepath, objname='pointer_nullify')
-    function()
-    clean_test(filepath)
 
-
-@pytest.mark.parametrize('frontend', available_frontends())
-def test_parameter_stmt(here, frontend):
+def _equals_all(expr, strings):
     """
-    PARAMETER(...) statement
+    Compare :data:`expr` against each of :data:`strings`, constructing the
+    expression only once
     """
-    fcode = """
-subroutine parameter_stmt(out1)
-  implicit none
-  integer, parameter :: jprb = selected_real_kind(13,300)
-  real(kind=jprb) :: param
-  parameter(param=2.0)
-  real(kind=jprb), intent(out) :: out1
-
-  out1 = param
-end subroutine parameter_stmt
-"""
-    filepath = here/(f'expression_parameter_stmt_{frontend}.f90')
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    function = jit_compile(routine, filepath=filepath, objname='parameter_stmt')
-
-    out1 = function()
-    assert out1 == 2.0
-    clean_test(filepath)
+    return all(expr == string for string in strings)
 
 
-def test_string_compare():
+def test_string_compare(scope):
     """
     Test that we can identify symbols and expressions by equivalent strings.
 
@@ -955,7 +1034,6 @@ def test_string_compare():
     not full symbolic equivalence.
     """
     # Utility objects for manual expression creation
-    scope = Scope()
     type_int = SymbolAttributes(dtype=BasicType.INTEGER)
     type_real = SymbolAttributes(dtype=BasicType.REAL)
 
@@ -963,29 +1041,29 @@ def test_string_compare():
     j = sym.Variable(name='j', scope=scope, type=type_int)
 
     # Test a scalar variable
-    u = sym.Variable(name='u', scope=scope, type=SymbolAttributes(dtype=BasicType.REAL))
-    assert all(u == exp for exp in ['u', 'U', 'u ', 'U '])
-    assert not all(u == exp for exp in ['u()', '_u', 'U()', '_U'])
+    u = sym.Variable(name='u', scope=scope, type=type_real)
+    assert _equals_all(u, ['u', 'U', 'u ', 'U '])
+    assert not _equals_all(u, ['u()', '_u', 'U()', '_U'])
 
     # Test an array variable
     v = sym.Variable(name='v', dimensions=(i, j), scope=scope, type=type_real)
-    assert all(v == exp for exp in ['v(i,j)', 'v(i, j)', 'v (i , j)', 'V(i,j)', 'V(I, J)'])
-    assert not all(v == exp for exp in ['v(i,j())', 'v(i,_j)', '_V(i,j)'])
+    assert _equals_all(v, ['v(i,j)', 'v(i, j)', 'v (i , j)', 'V(i,j)', 'V(I, J)'])
+    assert not _equals_all(v, ['v(i,j())', 'v(i,_j)', '_V(i,j)'])
 
     # Test a standard array dimension range
     r = sym.RangeIndex(children=(i, j))
     w = sym.Variable(name='w', dimensions=(r,), scope=scope, type=type_real)
-    assert all(w == exp for exp in ['w(i:j)', 'w (i : j)', 'W(i:J)', ' w( I:j)'])
+    assert _equals_all(w, ['w(i:j)', 'w (i : j)', 'W(i:J)', ' w( I:j)'])
 
     # Test simple arithmetic expressions
-    assert all(sym.Sum((i, u)) == exp for exp in ['i+u', 'i + u', 'i +  U', ' I + u'])
-    assert all(sym.Product((i, u)) == exp for exp in ['i*u', 'i * u', 'i *  U', ' I * u'])
-    assert all(sym.Quotient(i, u) == exp for exp in ['i/u', 'i / u', 'i /  U', ' I / u'])
-    assert all(sym.Power(i, u) == exp for exp in ['i**u', 'i ** u', 'i **  U', ' I ** u'])
-    assert all(sym.Comparison(i, '==', u) == exp for exp in ['i==u', 'i == u', 'i ==  U', ' I == u'])
-    assert all(sym.LogicalAnd((i, u)) == exp for exp in ['i AND u', 'i and u', 'i and  U', ' I and u'])
-    assert all(sym.LogicalOr((i, u)) == exp for exp in ['i OR u', 'i or u', 'i or  U', ' I oR u'])
-    assert all(sym.LogicalNot(u) == exp for exp in ['not u', ' nOt u', 'not  U', ' noT u'])
+    assert _equals_all(sym.Sum((i, u)), ['i+u', 'i + u', 'i +  U', ' I + u'])
+    assert _equals_all(sym.Product((i, u)), ['i*u', 'i * u', 'i *  U', ' I * u'])
+    assert _equals_all(sym.Quotient(i, u), ['i/u', 'i / u', 'i /  U', ' I / u'])
+    assert _equals_all(sym.Power(i, u), ['i**u', 'i ** u', 'i **  U', ' I ** u'])
+    assert _equals_all(sym.Comparison(i, '==', u), ['i==u', 'i == u', 'i ==  U', ' I == u'])
+    assert _equals_all(sym.LogicalAnd((i, u)), ['i AND u', 'i and u', 'i and  U', ' I and u'])
+    assert _equals_all(sym.LogicalOr((i, u)), ['i OR u', 'i or u', 'i or  U', ' I oR u'])
+    assert _equals_all(sym.LogicalNot(u), ['not u', ' nOt u', 'not  U', ' noT u'])
 
     # Test literal behaviour
     assert sym.Literal(41) == 41
@@ -1002,6 +1080,14 @@ def test_string_compare():
     assert sym.LogicLiteral(value=True) == 'true'
 
 
+# The expression parsers to test, shared by all tests parametrized over 'parse'
+_EXPRESSION_PARSERS = (
+    parse_expr,
+    pytest.param(parse_fparser_expression,
+        marks=pytest.mark.skipif(not HAVE_FP, reason='parse_fparser_expression not available!'))
+)
+
+
 @pytest.mark.parametrize('expr, string, ref', [
     ('a + 1', 'a', True),
     ('u(a)', 'a', True),
@@ -1010,17 +1096,12 @@ def test_string_compare():
     ('ansatz(a + 1)', 'a', True),
     ('ansatz(b + 1)', 'a', False),  # Ensure no false positives
 ])
-@pytest.mark.parametrize('parse', (
-    parse_expr,
-    pytest.param(parse_fparser_expression,
-        marks=pytest.mark.skipif(not HAVE_FP, reason='parse_fparser_expression not available!'))
-))
-def test_subexpression_match(parse, expr, string, ref):
+@pytest.mark.parametrize('parse', _EXPRESSION_PARSERS)
+def test_subexpression_match(parse, expr, string, ref, scope):
     """
     Test that we can identify individual symbols or sub-expressions in
     expressions via canonical string matching.
     """
-    scope = Scope()
     expr = parse(expr, scope)
     assert (string in expr) == ref
 
@@ -1034,39 +1115,61 @@ def test_subexpression_match(parse, expr, string, ref):
     ('5 + (4 + 3) - (2*1)', '5 + (4 + 3) - (2*1)'),
     ('a*(b*(c+(d+e)))', 'a*(b*(c + (d + e)))'),
 ])
-@pytest.mark.parametrize('parse', (
-    parse_expr,
-    pytest.param(parse_fparser_expression,
-        marks=pytest.mark.skipif(not HAVE_FP, reason='parse_fparser_expression not available!'))
-))
-def test_parse_expression(parse, source, ref):
+@pytest.mark.parametrize('parse', _EXPRESSION_PARSERS)
+def test_parse_expression(parse, source, ref, scope):
     """
     Test the utility function that parses simple expressions.
     """
-    scope = Scope()
     ir = parse(source, scope)  # pylint: disable=redefined-outer-name
     assert isinstance(ir, pmbl.Expression)
     assert str(ir) == ref
 
 
+# Symbol attributes used in the parametrizations of the variable tests below.
+# They are referenced by name and created afresh for every test via
+# :meth:`_symbol_type`, as :any:`SymbolAttributes` objects are mutable.
+_SYMBOL_TYPES = {
+    'deferred': lambda: SymbolAttributes(BasicType.DEFERRED),
+    'deferred_in': lambda: SymbolAttributes(BasicType.DEFERRED, intent='in'),
+    'int': lambda: SymbolAttributes(BasicType.INTEGER),
+    'int_shape3': lambda: SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(3),)),
+    'int_shape4': lambda: SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(4),)),
+    'int_shape5': lambda: SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(5),)),
+    'real': lambda: SymbolAttributes(BasicType.REAL),
+    'derived': lambda: SymbolAttributes(DerivedType('t')),
+    'routine': lambda: SymbolAttributes(ProcedureType('routine')),
+    'foo': lambda: SymbolAttributes(ProcedureType('foo')),
+}
+
+
+def _symbol_type(name):
+    """
+    Create a new :any:`SymbolAttributes` object for :data:`name` in :data:`_SYMBOL_TYPES`,
+    or return `None` if :data:`name` is `None`
+    """
+    if name is None:
+        return None
+    return _SYMBOL_TYPES[name]()
+
+
 @pytest.mark.parametrize('kwargs,reftype', [
     ({}, sym.DeferredTypeSymbol),
-    ({'type': SymbolAttributes(BasicType.DEFERRED)}, sym.DeferredTypeSymbol),
-    ({'type': SymbolAttributes(BasicType.INTEGER)}, sym.Scalar),
-    ({'type': SymbolAttributes(BasicType.REAL)}, sym.Scalar),
-    ({'type': SymbolAttributes(DerivedType('t'))}, sym.Scalar),
-    ({'type': SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(3),))}, sym.Array),
-    ({'type': SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(3),)),
-      'dimensions': (sym.Literal(1),)}, sym.Array),
-    ({'type': SymbolAttributes(BasicType.INTEGER), 'dimensions': (sym.Literal(1),)}, sym.Array),
-    ({'type': SymbolAttributes(BasicType.DEFERRED), 'dimensions': (sym.Literal(1),)}, sym.Array),
-    ({'type': SymbolAttributes(ProcedureType('routine'))}, sym.ProcedureSymbol),
+    ({'type': 'deferred'}, sym.DeferredTypeSymbol),
+    ({'type': 'int'}, sym.Scalar),
+    ({'type': 'real'}, sym.Scalar),
+    ({'type': 'derived'}, sym.Scalar),
+    ({'type': 'int_shape3'}, sym.Array),
+    ({'type': 'int_shape3', 'dimensions': (sym.Literal(1),)}, sym.Array),
+    ({'type': 'int', 'dimensions': (sym.Literal(1),)}, sym.Array),
+    ({'type': 'deferred', 'dimensions': (sym.Literal(1),)}, sym.Array),
+    ({'type': 'routine'}, sym.ProcedureSymbol),
 ])
-def test_variable_factory(kwargs, reftype):
+def test_variable_factory(kwargs, reftype, scope):
     """
     Test the factory class :any:`Variable` and the dispatch to correct classes.
     """
-    scope = Scope()
+    if 'type' in kwargs:
+        kwargs = {**kwargs, 'type': _symbol_type(kwargs['type'])}
     assert isinstance(sym.Variable(name='var', scope=scope, **kwargs), reftype)
 
 
@@ -1078,48 +1181,37 @@ def test_variable_factory_invalid():
         _ = sym.Variable()
 
 
-@pytest.mark.parametrize('initype,inireftype,newtype,newreftype', [
+# Changes of a variable's type and the expected classes before and after
+_VARIABLE_TYPE_CHANGES = [
     # From deferred type to other type
-    (SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol,
-     SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol),
-    (SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol,
-     SymbolAttributes(BasicType.INTEGER), sym.Scalar),
-    (SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol,
-     SymbolAttributes(BasicType.REAL), sym.Scalar),
-    (SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol,
-     SymbolAttributes(DerivedType('t')), sym.Scalar),
-    (SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol,
-     SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(4),)), sym.Array),
-    (SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol,
-     SymbolAttributes(ProcedureType('routine')), sym.ProcedureSymbol),
-    (None, sym.DeferredTypeSymbol, SymbolAttributes(BasicType.INTEGER), sym.Scalar),
+    ('deferred', sym.DeferredTypeSymbol, 'deferred', sym.DeferredTypeSymbol),
+    ('deferred', sym.DeferredTypeSymbol, 'int', sym.Scalar),
+    ('deferred', sym.DeferredTypeSymbol, 'real', sym.Scalar),
+    ('deferred', sym.DeferredTypeSymbol, 'derived', sym.Scalar),
+    ('deferred', sym.DeferredTypeSymbol, 'int_shape4', sym.Array),
+    ('deferred', sym.DeferredTypeSymbol, 'routine', sym.ProcedureSymbol),
+    (None, sym.DeferredTypeSymbol, 'int', sym.Scalar),
     # From Scalar to other type
-    (SymbolAttributes(BasicType.INTEGER), sym.Scalar,
-     SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol),
-    (SymbolAttributes(BasicType.INTEGER), sym.Scalar,
-     SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(3),)), sym.Array),
-    (SymbolAttributes(BasicType.INTEGER), sym.Scalar,
-     SymbolAttributes(ProcedureType('foo')), sym.ProcedureSymbol),
+    ('int', sym.Scalar, 'deferred', sym.DeferredTypeSymbol),
+    ('int', sym.Scalar, 'int_shape3', sym.Array),
+    ('int', sym.Scalar, 'foo', sym.ProcedureSymbol),
     # From Array to other type
-    (SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(4),)), sym.Array,
-     SymbolAttributes(BasicType.INTEGER), sym.Scalar),
-    (SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(4),)), sym.Array,
-     SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol),
-    (SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(4),)), sym.Array,
-     SymbolAttributes(ProcedureType('foo')), sym.ProcedureSymbol),
+    ('int_shape4', sym.Array, 'int', sym.Scalar),
+    ('int_shape4', sym.Array, 'deferred', sym.DeferredTypeSymbol),
+    ('int_shape4', sym.Array, 'foo', sym.ProcedureSymbol),
     # From ProcedureSymbol to other type
-    (SymbolAttributes(ProcedureType('foo')), sym.ProcedureSymbol,
-     SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol),
-    (SymbolAttributes(ProcedureType('foo')), sym.ProcedureSymbol,
-     SymbolAttributes(BasicType.INTEGER), sym.Scalar),
-    (SymbolAttributes(ProcedureType('foo')), sym.ProcedureSymbol,
-     SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(5),)), sym.Array),
-])
-def test_variable_rebuild(initype, inireftype, newtype, newreftype):
+    ('foo', sym.ProcedureSymbol, 'deferred', sym.DeferredTypeSymbol),
+    ('foo', sym.ProcedureSymbol, 'int', sym.Scalar),
+    ('foo', sym.ProcedureSymbol, 'int_shape5', sym.Array),
+]
+
+
+@pytest.mark.parametrize('initype,inireftype,newtype,newreftype', _VARIABLE_TYPE_CHANGES)
+def test_variable_rebuild(initype, inireftype, newtype, newreftype, scope):
     """
     Test that rebuilding a variable object changes class according to symmbol type
     """
-    scope = Scope()
+    initype, newtype = _symbol_type(initype), _symbol_type(newtype)
     var = sym.Variable(name='var', scope=scope, type=initype)
     assert isinstance(var, inireftype)
     assert 'var' in scope.symbol_attrs
@@ -1129,48 +1221,12 @@ def test_variable_rebuild(initype, inireftype, newtype, newreftype):
     assert isinstance(var, newreftype)
 
 
-@pytest.mark.parametrize('initype,inireftype,newtype,newreftype', [
-    # From deferred type to other type
-    (SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol,
-     SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol),
-    (SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol,
-     SymbolAttributes(BasicType.INTEGER), sym.Scalar),
-    (SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol,
-     SymbolAttributes(BasicType.REAL), sym.Scalar),
-    (SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol,
-     SymbolAttributes(DerivedType('t')), sym.Scalar),
-    (SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol,
-     SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(4),)), sym.Array),
-    (SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol,
-     SymbolAttributes(ProcedureType('routine')), sym.ProcedureSymbol),
-    (None, sym.DeferredTypeSymbol, SymbolAttributes(BasicType.INTEGER), sym.Scalar),
-    # From Scalar to other type
-    (SymbolAttributes(BasicType.INTEGER), sym.Scalar,
-     SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol),
-    (SymbolAttributes(BasicType.INTEGER), sym.Scalar,
-     SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(3),)), sym.Array),
-    (SymbolAttributes(BasicType.INTEGER), sym.Scalar,
-     SymbolAttributes(ProcedureType('foo')), sym.ProcedureSymbol),
-    # From Array to other type
-    (SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(4),)), sym.Array,
-     SymbolAttributes(BasicType.INTEGER), sym.Scalar),
-    (SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(4),)), sym.Array,
-     SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol),
-    (SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(4),)), sym.Array,
-     SymbolAttributes(ProcedureType('foo')), sym.ProcedureSymbol),
-    # From ProcedureSymbol to other type
-    (SymbolAttributes(ProcedureType('foo')), sym.ProcedureSymbol,
-     SymbolAttributes(BasicType.DEFERRED), sym.DeferredTypeSymbol),
-    (SymbolAttributes(ProcedureType('foo')), sym.ProcedureSymbol,
-     SymbolAttributes(BasicType.INTEGER), sym.Scalar),
-    (SymbolAttributes(ProcedureType('foo')), sym.ProcedureSymbol,
-     SymbolAttributes(BasicType.INTEGER, shape=(sym.Literal(5),)), sym.Array),
-])
-def test_variable_clone_class(initype, inireftype, newtype, newreftype):
+@pytest.mark.parametrize('initype,inireftype,newtype,newreftype', _VARIABLE_TYPE_CHANGES)
+def test_variable_clone_class(initype, inireftype, newtype, newreftype, scope):
     """
     Test that cloning a variable object changes class according to symbol type
     """
-    scope = Scope()
+    initype, newtype = _symbol_type(initype), _symbol_type(newtype)
     var = sym.Variable(name='var', scope=scope, type=initype)
     assert isinstance(var, inireftype)
     assert 'var' in scope.symbol_attrs
@@ -1179,31 +1235,24 @@ def test_variable_clone_class(initype, inireftype, newtype, newreftype):
 
 @pytest.mark.parametrize('initype,newtype,reftype', [
     # Preserve existing type info if type=None is given
-    (SymbolAttributes(BasicType.REAL), None, SymbolAttributes(BasicType.REAL)),
-    (SymbolAttributes(BasicType.INTEGER), None, SymbolAttributes(BasicType.INTEGER)),
-    (SymbolAttributes(BasicType.DEFERRED), None, SymbolAttributes(BasicType.DEFERRED)),
-    (SymbolAttributes(BasicType.DEFERRED, intent='in'), None,
-     SymbolAttributes(BasicType.DEFERRED, intent='in')),
+    ('real', None, 'real'),
+    ('int', None, 'int'),
+    ('deferred', None, 'deferred'),
+    ('deferred_in', None, 'deferred_in'),
     # Update from deferred to known type
-    (SymbolAttributes(BasicType.DEFERRED), SymbolAttributes(BasicType.INTEGER),
-     SymbolAttributes(BasicType.INTEGER)),
-    (SymbolAttributes(BasicType.DEFERRED), SymbolAttributes(BasicType.REAL),
-     SymbolAttributes(BasicType.REAL)),
-    (SymbolAttributes(BasicType.DEFERRED), SymbolAttributes(BasicType.DEFERRED, intent='in'),
-     SymbolAttributes(BasicType.DEFERRED, intent='in')),  # Special case: Add attribute only
+    ('deferred', 'int', 'int'),
+    ('deferred', 'real', 'real'),
+    ('deferred', 'deferred_in', 'deferred_in'),  # Special case: Add attribute only
     # Invalidate type by setting to DEFERRED
-    (SymbolAttributes(BasicType.INTEGER), SymbolAttributes(BasicType.DEFERRED),
-     SymbolAttributes(BasicType.DEFERRED)),
-    (SymbolAttributes(BasicType.REAL), SymbolAttributes(BasicType.DEFERRED),
-     SymbolAttributes(BasicType.DEFERRED)),
-    (SymbolAttributes(BasicType.DEFERRED, intent='in'), SymbolAttributes(BasicType.DEFERRED),
-     SymbolAttributes(BasicType.DEFERRED)),
+    ('int', 'deferred', 'deferred'),
+    ('real', 'deferred', 'deferred'),
+    ('deferred_in', 'deferred', 'deferred'),
 ])
-def test_variable_clone_type(initype, newtype, reftype):
+def test_variable_clone_type(initype, newtype, reftype, scope):
     """
     Test type updates are handled as expected and types are never ``None``.
     """
-    scope = Scope()
+    initype, newtype, reftype = _symbol_type(initype), _symbol_type(newtype), _symbol_type(reftype)
     var = sym.Variable(name='var', scope=scope, type=initype)
     assert 'var' in scope.symbol_attrs
     new = var.clone(type=newtype)  # pylint: disable=no-member
@@ -1281,30 +1330,20 @@ def test_variable_without_scope():
     ('5 + (-1)'),
     ('5 - 1')
 ])
-@pytest.mark.parametrize('parse', (
-    parse_expr,
-    pytest.param(parse_fparser_expression,
-        marks=pytest.mark.skipif(not HAVE_FP, reason='parse_fparser_expression not available!'))
-))
-def test_standalone_expr_parenthesis(expr, parse):
-    scope = Scope()
+@pytest.mark.parametrize('parse', _EXPRESSION_PARSERS)
+def test_standalone_expr_parenthesis(expr, parse, scope):
     ir = parse(expr, scope)  # pylint: disable=redefined-outer-name
     assert isinstance(ir, pmbl.Expression)
     assert fgen(ir) == expr
 
 
-@pytest.mark.parametrize('parse', (
-    parse_expr,
-    pytest.param(parse_fparser_expression,
-        marks=pytest.mark.skipif(not HAVE_FP, reason='parse_fparser_expression not available!'))
-))
-def test_array_to_inline_call_rescope(parse):
+@pytest.mark.parametrize('parse', _EXPRESSION_PARSERS)
+def test_array_to_inline_call_rescope(parse, scope):
     """
     Test a mechanism that can convert arrays to procedure calls, to mop up
     broken frontend behaviour wrongly classifying inline calls as array subscripts
     """
     # Parse the expression, which fparser will interpret as an array
-    scope = Scope()
     expr = parse('FLUX%OUT_OF_PHYSICAL_BOUNDS(KIDIA, KFDIA)', scope=scope)
     assert isinstance(expr, sym.Array)
 
@@ -1322,7 +1361,6 @@ def test_array_to_inline_call_rescope(parse):
     assert expr.parameters == ('kidia', 'kfdia')
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
 def test_recursive_substitution(frontend):
     """
     Test expression substitution where the substitution key is included
@@ -1339,16 +1377,16 @@ subroutine my_routine(var, n)
 end subroutine my_routine
     """.strip()
 
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    assignment = FindNodes(ir.Assignment).visit(routine.body)[0]
+    routine = _cached_subroutine(fcode, frontend)
+    assignment = _find_nodes(routine.body, ir.Assignment)[0]
     assert assignment.lhs == 'var(j)'
 
     # Replace Array subscript by j+1
     j = routine.variable_map['j']
     expr_map = {j: sym.Sum((j, sym.Literal(1)))}
-    assert j in FindVariables().visit(list(expr_map.values()))
+    assert j in _FIND_VARIABLES.visit(list(expr_map.values()))
     routine.body = SubstituteExpressions(expr_map).visit(routine.body)
-    assignment = FindNodes(ir.Assignment).visit(routine.body)[0]
+    assignment = _find_nodes(routine.body, ir.Assignment)[0]
     assert assignment.lhs == 'var(j + 1)'
 
 
@@ -1367,7 +1405,6 @@ def test_nested_derived_type_substitution():
     assert fgen(new_expr) == 'ydml_phy_mf%yrphy3%n_spband'
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
 def test_variable_in_declaration_initializer(frontend):
     """
     Check correct handling of cases where the variable appears
@@ -1390,18 +1427,17 @@ end subroutine some_routine
         assert zexplimit.scope is routine_
         # Now let's take a closer look at the initializer expression
         assert 'zexplimit' in str(zexplimit.type.initial).lower()
-        variables = FindVariables().visit(zexplimit.type.initial)
+        variables = _FIND_VARIABLES.visit(zexplimit.type.initial)
         assert 'zexplimit' in variables
         assert variables[variables.index('zexplimit')].scope is routine_
 
-    routine = Subroutine.from_source(fcode, frontend=frontend)
+    routine = _cached_subroutine(fcode, frontend)
     _check(routine)
     # Make sure that's still true when doing another scope attachment
     routine.rescope_symbols()
     _check(routine)
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
 def test_variable_in_dimensions(frontend):
     """
     Check correct handling of cases where the variable appears in the
@@ -1428,7 +1464,7 @@ contains
 end module some_mod
     """.strip()
 
-    module = Module.from_source(fcode, frontend=frontend)
+    module = _cached_module(fcode, frontend, clone=False)
     routine = module['some_routine']
     assert 'levels%data' in routine.symbol_attrs
     shape = routine.symbol_attrs['levels%data'].shape
@@ -1438,12 +1474,22 @@ end module some_mod
         assert str(dim).lower() == f'size(levels(jscale - 1)%data, {i+1})'
 
 
-def test_expression_container_matching():
+def _container_flavours(key, value):
+    """
+    Build the different container types that hold :data:`key` as an element
+    or as a dictionary key
+    """
+    return (
+        (key, value), [key, value], {key, value}, {key: value},
+        defaultdict(list, ((key, [value]),))
+    )
+
+
+def test_expression_container_matching(scope):
     """
     Tests how different expression types match as keys in different
     containers, with use of raw expressions and string equivalence.
     """
-    scope = Scope()
     t_real = SymbolAttributes(BasicType.REAL)
     t_int = SymbolAttributes(BasicType.INTEGER)
 
@@ -1452,37 +1498,24 @@ def test_expression_container_matching():
     b = sym.Variable(name='b', scope=scope, type=t_real, dimensions=(i,))
 
     # Test for simple containment of scalars
-    assert a in (a, b)
-    assert a in [a, b]
-    assert a in {a, b}
-    assert a in {a: b}
-    assert a in defaultdict(list, ((a, [b]),))
+    for container in _container_flavours(a, b):
+        assert a in container
 
     # Test for simple containment of scalars against strings
     assert a == 'a'
-    assert a in ('a', 'b(i)')
-    assert a in ['a', 'b(i)']
-    assert a in {'a', 'b(i)'}
-    assert a in {'a': 'b(i)'}
-    assert a in defaultdict(list, (('a', ['b(i)']),))
+    for container in _container_flavours('a', 'b(i)'):
+        assert a in container
 
     # Test for simple containment of arrays against strings
     assert b == 'b(i)'
-    assert b in ('b(i)', 'a')
-    assert b in ['b(i)', 'a']
-    assert b in {'b(i)', 'a'}
-    assert b in {'b(i)': 'a'}
-    assert b in defaultdict(list, (('b(i)', ['a']),))
+    for container in _container_flavours('b(i)', 'a'):
+        assert b in container
 
     # Test for simple containment of strings indices against arrays
-    assert 'b(i)' in (b, a)
-    assert 'b(i)' in [b, a]
-    assert 'b(i)' in {b, a}
-    assert 'b(i)' in {b: a}
-    assert 'b(i)' in defaultdict(list, ((b, [a]),))
+    for container in _container_flavours(b, a):
+        assert 'b(i)' in container
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
 def test_expression_finder_retrieval_function(frontend):
     """
     Verify that expression finder visitors work as intended and remain
@@ -1524,7 +1557,6 @@ end module some_mod
     assert find_ts.visit(source['other_routine'].body) == expected_ts
 
 
-@pytest.mark.parametrize('frontend', available_frontends())
 def test_expression_c_de_reference(frontend):
     """
     Verify that ```Reference`` and ``Dereference`` work as expected.
@@ -1542,7 +1574,7 @@ implicit none
 end subroutine some_routine
     """.strip()
 
-    routine = Subroutine.from_source(fcode, frontend=frontend)
+    routine = _cached_subroutine(fcode, frontend)
     var_map = {
         routine.variable_map['var_reference']: sym.Reference(routine.variable_map['var_reference']),
         routine.variable_map['var_dereference']: sym.Dereference(routine.variable_map['var_dereference'])
@@ -1564,8 +1596,9 @@ end subroutine some_routine
     var_dereference = routine.variable_map['var_dereference']
     var_map = {var_reference: var_reference.clone(name='renamed_var_reference'),
             var_dereference: var_dereference.clone(name='renamed_var_dereference')}
-    routine.spec = SubstituteExpressions(var_map).visit(routine.spec)
-    routine.body = SubstituteExpressions(var_map).visit(routine.body)
+    substitute = SubstituteExpressions(var_map)
+    routine.spec = substitute.visit(routine.spec)
+    routine.body = substitute.visit(routine.body)
 
     f_str = fgen(routine).replace(' ', '')
     assert 'renamed_var_reference=1' in f_str
@@ -1581,12 +1614,11 @@ end subroutine some_routine
 @pytest.mark.parametrize('expr', [
     'a', 'a%b', 'a%b%c', 'a%b%c%d', 'a%b%c%d%e'
 ])
-def test_typebound_resolution(expr):
+def test_typebound_resolution(expr, scope):
     """
     Test that type-bound variables can be correctly resolved
     """
 
-    scope = Scope()
     name_parts = expr.split('%', maxsplit=1)
     var = sym.Variable(name=name_parts[0], scope=scope)
 
@@ -1626,7 +1658,7 @@ contains
 end module typebound_resolution_type_info_mod
     """.strip()
 
-    module = Module.from_source(fcode, frontend=frontend)
+    module = _cached_module(fcode, frontend)
 
     sub = module['sub']
     var_c = sub.variable_map['var_c']
@@ -1674,33 +1706,53 @@ end module typebound_resolution_type_info_mod
         assert var.type.dtype == dtype
 
 
-# utility function to test parse_expr with different case
-def convert_to_case(_str, mode='upper'):
-    if mode == 'upper':
-        return _str.upper()
-    if mode == 'lower':
-        return _str.lower()
-    if mode == 'random':
-        # this is obviously not random, but fulfils its purpose ...
-        result = ''
-        for i, char in enumerate(_str):
-            result += char.upper() if i%2==0 and i<3 else char.lower()
-        return result
-    return convert_to_case(_str)
-
-
-@pytest.mark.parametrize('case', ('upper', 'lower', 'random'))
-@pytest.mark.parametrize('frontend', available_frontends())
-def test_expression_parser(frontend, case):
-    fcode = """
+_FCODE_PARSER_ROUTINE = """
 subroutine some_routine()
   implicit none
   integer :: i1, i2, i3, len1, len2, len3
   real :: a, b
   real :: arr(len1, len2, len3)
 end subroutine some_routine
-    """.strip()
+""".strip()
+
+
+_COMPARISON_EXPRESSIONS = (
+    ('a == b', '=='), ('a.eq.b', '=='),
+    ('a!=b', '!='), ('a.ne.b', '!='),
+    ('a>b', '>'), ('a.gt.b', '>'),
+    ('a>=b', '>='), ('a.ge.b', '>='),
+    ('a<b', '<'), ('a.lt.b', '<'),
+    ('a<=b', '<='), ('a.le.b', '<='),
+)
+"""Comparisons in both notations and the operator they are parsed into"""
+
+
+_STRIP_SPACES = str.maketrans('', '', ' ')
+
+
+def _to_str(expr):
+    """
+    Lower-case string representation of :data:`expr` without spaces
+    """
+    return str(expr).lower().translate(_STRIP_SPACES)
+
 
+def _mixed_case(_str):
+    # this is obviously not random, but fulfils its purpose ...
+    return ''.join([char.upper() if i%2==0 and i<3 else char.lower() for i, char in enumerate(_str)])
+
+
+_CASE_CONVERSIONS = {'upper': str.upper, 'lower': str.lower, 'random': _mixed_case}
+
+
+# utility function to test parse_expr with different case
+@lru_cache(maxsize=None)
+def convert_to_case(_str, mode='upper'):
+    return _CASE_CONVERSIONS.get(mode, str.upper)(_str)
+
+
+@pytest.mark.parametrize('case', ('upper', 'lower', 'random'))
+def test_expression_parser(frontend, case):
     fcode_mod = """
 module external_mod
   implicit none
@@ -1713,143 +1765,64 @@ contains
 end module external_mod
     """.strip()
 
-    def to_str(_parsed):
-        return str(_parsed).lower().replace(' ', '')
-
-    routine = Subroutine.from_source(fcode, frontend=frontend)
-    module = Module.from_source(fcode_mod, frontend=frontend)
+    # The parser only looks up symbols, so all cases can share the same objects
+    routine = _cached_subroutine(_FCODE_PARSER_ROUTINE, frontend, clone=False)
+    module = _cached_module(fcode_mod, frontend, clone=False)
 
     parsed = parse_expr(convert_to_case('a + b', mode=case))
     assert isinstance(parsed, sym.Sum)
     assert all(isinstance(_parsed,  sym.DeferredTypeSymbol) for _parsed in parsed.children)
-    assert to_str(parsed) == 'a+b'
+    assert _to_str(parsed) == 'a+b'
 
     parsed = parse_expr(convert_to_case('a + b', mode=case), scope=routine)
     assert isinstance(parsed, sym.Sum)
     assert all(isinstance(_parsed,  sym.Scalar) for _parsed in parsed.children)
     assert all(_parsed.scope == routine for _parsed in parsed.children)
-    assert to_str(parsed) == 'a+b'
+    assert _to_str(parsed) == 'a+b'
 
     parsed = parse_expr(convert_to_case('a + b + 2 + 10', mode=case), scope=routine)
     assert isinstance(parsed, sym.Sum)
-    assert to_str(parsed) == 'a+b+2+10'
+    assert _to_str(parsed) == 'a+b+2+10'
 
     parsed = parse_expr(convert_to_case('a - b', mode=case), scope=routine)
     assert isinstance(parsed, sym.Sum)
     assert isinstance(parsed.children[0], sym.Scalar)
     assert isinstance(parsed.children[1], sym.Product)
-    assert to_str(parsed) == 'a-b'
+    assert _to_str(parsed) == 'a-b'
 
     parsed = parse_expr(convert_to_case('a * b', mode=case), scope=routine)
     assert isinstance(parsed, sym.Product)
     assert all(isinstance(_parsed,  sym.Scalar) for _parsed in parsed.children)
     assert all(_parsed.scope == routine for _parsed in parsed.children)
-    assert to_str(parsed) == 'a*b'
+    assert _to_str(parsed) == 'a*b'
 
     parsed = parse_expr(convert_to_case('a / b', mode=case), scope=routine)
     assert isinstance(parsed, sym.Quotient)
     assert all(isinstance(_parsed,  sym.Scalar) for _parsed in [parsed.numerator, parsed.denominator])
     assert all(_parsed.scope == routine for _parsed in [parsed.numerator, parsed.denominator])
-    assert to_str(parsed) == 'a/b'
+    assert _to_str(parsed) == 'a/b'
 
     parsed = parse_expr(convert_to_case('a ** b', mode=case), scope=routine)
     assert isinstance(parsed, sym.Power)
     assert all(isinstance(_parsed,  sym.Scalar) for _parsed in [parsed.base, parsed.exponent])
     assert all(_parsed.scope == routine for _parsed in [parsed.base, parsed.exponent])
-    assert to_str(parsed) == 'a**b'
+    assert _to_str(parsed) == 'a**b'
 
     parsed = parse_expr(convert_to_case(':', mode=case))
     assert isinstance(parsed, sym.RangeIndex)
-    assert to_str(parsed) == ':'
+    assert _to_str(parsed) == ':'
 
     parsed = parse_expr(convert_to_case('a:b', mode=case), scope=routine)
     assert isinstance(parsed, sym.RangeIndex)
     assert all(isinstance(_parsed,  sym.Scalar) for _parsed in [parsed.lower, parsed.upper])
     assert all(_parsed.scope == routine for _parsed in [parsed.lower, parsed.upper])
-    assert to_str(parsed) == 'a:b'
+    assert _to_str(parsed) == 'a:b'
 
     parsed = parse_expr(convert_to_case('a:b:5', mode=case), scope=routine)
     assert isinstance(parsed, sym.RangeIndex)
     assert all(isinstance(_parsed,  (sym.Scalar, sym.IntLiteral))
             for _parsed in [parsed.lower, parsed.upper, parsed.step])
-    assert to_str(parsed) == 'a:b:5'
-
-    parsed = parse_expr(convert_to_case('a == b', mode=case), scope=routine)
-    assert parsed.operator == '=='
-    assert isinstance(parsed, sym.Comparison)
-    assert all(isinstance(_parsed,  sym.Scalar) for _parsed in [parsed.left, parsed.right])
-    assert all(_parsed.scope == routine for _parsed in [parsed.left, parsed.right])
-    assert to_str(parsed) == 'a==b'
-    parsed = parse_expr(convert_to_case('a.eq.b', mode=case), scope=routine)
-    assert parsed.operator == '=='
-    assert isinstance(parsed, sym.Comparison)
-    assert all(isinstance(_parsed,  sym.Scalar) for _parsed in [parsed.left, parsed.right])
-    assert all(_parsed.scope == routine for _parsed in [parsed.left, parsed.right])
-    assert to_str(parsed) == 'a==b'
-
-    parsed = parse_expr(convert_to_case('a!=b', mode=case), scope=routine)
-    assert parsed.operator == '!='
-    assert isinstance(parsed, sym.Comparison)
-    assert all(isinstance(_parsed,  sym.Scalar) for _parsed in [parsed.left, parsed.right])
-    assert all(_parsed.scope == routine for _parsed in [parsed.left, parsed.right])
-    assert to_str(parsed) == 'a!=b'
-    parsed = parse_expr(convert_to_case('a.ne.b', mode=case), scope=routine)
-    assert parsed.operator == '!='
-    assert isinstance(parsed, sym.Comparison)
-    assert all(isinstance(_parsed,  sym.Scalar) for _parsed in [parsed.left, parsed.right])
-    assert all(_parsed.scope == routine for _parsed in [parsed.left, parsed.right])
-    assert to_str(parsed) == 'a!=b'
-
-    parsed = parse_expr(convert_to_case('a>b', mode=case), scope=routine)
-    assert parsed.operator == '>'
-    assert isinstance(parsed, sym.Comparison)
-    assert all(isinstance(_parsed,  sym.Scalar) for _parsed in [parsed.left, parsed.right])
-    assert all(_parsed.scope == routine for _parsed in [parsed.left, parsed.right])
-    assert to_str(parsed) == 'a>b'
-    parsed = parse_expr(convert_to_case('a.gt.b', mode=case), scope=routine)
-    assert parsed.operator == '>'
-    assert isinstance(parsed, sym.Comparison)
-    assert all(isinstance(_parsed,  sym.Scalar) for _parsed in [parsed.left, parsed.right])
-    assert all(_parsed.scope == routine for _parsed in [parsed.left, parsed.right])
-    assert to_str(parsed) == 'a>b'
-
-    parsed = parse_expr(convert_to_case('a>=b', mode=case), scope=routine)
-    assert parsed.operator == '>='
-    assert isinstance(parsed, sym.Comparison)
-    assert all(isinstance(_parsed,  sym.Scalar) for _parsed in [parsed.left, parsed.right])
-    assert all(_parsed.scope == routine for _parsed in [parsed.left, parsed.right])
-    assert to_str(parsed) == 'a>=b'
-    parsed = parse_expr(convert_to_case('a.ge.b', mode=case), scope=routine)
-    assert parsed.operator == '>='
-    assert isinstance(parsed, sym.Comparison)
-    assert all(isinstance(_parsed,  sym.Scalar) for _parsed in [parsed.left, parsed.right])
-    assert all(_parsed.scope == routine for _parsed in [parsed.left, parsed.right])
-    assert to_str(parsed) == 'a>=b'
-
-    parsed = parse_expr(convert_to_case('a<b', mode=case), scope=routine)
-    assert parsed.operator == '<'
-    assert isinstance(parsed, sym.Comparison)
-    assert all(isinstance(_parsed,  sym.Scalar) for _parsed in [parsed.left, parsed.right])
-    assert all(_parsed.scope == routine for _parsed in [parsed.left, parsed.right])
-    assert to_str(parsed) == 'a<b'
-    parsed = parse_expr(convert_to_case('a.lt.b', mode=case), scope=routine)
-    assert parsed.operator == '<'
-    assert isinstance(parsed, sym.Comparison)
-    assert all(isinstance(_parsed,  sym.Scalar) for _parsed in [parsed.left, parsed.right])
-    assert all(_parsed.scope == routine for _parsed in [parsed.left, parsed.right])
-    assert to_str(parsed) == 'a<b'
-
-    parsed = parse_expr(convert_to_case('a<=b', mode=case), scope=routine)
-    assert parsed.operator == '<='
-    assert isinstance(parsed, sym.Comparison)
-    assert all(isinstance(_parsed,  sym.Scalar) for _parsed in [parsed.left, parsed.right])
-    assert to_str(parsed) == 'a<=b'
-    parsed = parse_expr(convert_to_case('a.le.b', mode=case), scope=routine)
-    assert parsed.operator == '<='
-    assert isinstance(parsed, sym.Comparison)
-    assert all(isinstance(_parsed,  sym.Scalar) for _parsed in [parsed.left, parsed.right])
-    assert all(_parsed.scope == routine for _parsed in [parsed.left, parsed.right])
-    assert to_str(parsed) == 'a<=b'
+    assert _to_str(parsed) == 'a:b:5'
 
     parsed = parse_expr(convert_to_case('arr(i1, i2, i3)', mode=case))
     assert isinstance(parsed, sym.Array)
@@ -1866,86 +1839,86 @@ end module external_mod
     else:
         assert all(isinstance(_parsed,  sym.Scalar) for _parsed in parsed.shape)
         assert all(_parsed.scope == routine for _parsed in parsed.shape)
-    assert to_str(parsed) == 'arr(i1,i2,i3)'
+    assert _to_str(parsed) == 'arr(i1,i2,i3)'
 
     parsed = parse_expr(convert_to_case('my_func(i1)', mode=case), scope=routine)
     assert isinstance(parsed, sym.Array)
-    assert to_str(parsed) == 'my_func(i1)'
+    assert _to_str(parsed) == 'my_func(i1)'
     parsed = parse_expr(convert_to_case('my_func(i1)', mode=case), scope=module)
     assert isinstance(parsed, sym.InlineCall)
-    assert to_str(parsed) == 'my_func(i1)'
+    assert _to_str(parsed) == 'my_func(i1)'
 
     parsed = parse_expr(convert_to_case('min(i1, i2)', mode=case), scope=module)
     assert isinstance(parsed, sym.InlineCall)
-    assert to_str(parsed) == 'min(i1,i2)'
+    assert _to_str(parsed) == 'min(i1,i2)'
 
     parsed = parse_expr(convert_to_case('a', mode=case))
     assert isinstance(parsed, sym.DeferredTypeSymbol)
-    assert to_str(parsed) == 'a'
+    assert _to_str(parsed) == 'a'
     parsed = parse_expr(convert_to_case('a', mode=case), scope=routine)
     assert isinstance(parsed, sym.Scalar)
     assert parsed.scope == routine
-    assert to_str(parsed) == 'a'
+    assert _to_str(parsed) == 'a'
     parsed = parse_expr(convert_to_case('3.1415', mode=case))
     assert isinstance(parsed, sym.FloatLiteral)
-    assert to_str(parsed) == '3.1415'
+    assert _to_str(parsed) == '3.1415'
 
     parsed = parse_expr(convert_to_case('some_type%val', mode=case))
     assert isinstance(parsed, sym.DeferredTypeSymbol)
     assert isinstance(parsed.parent, sym.DeferredTypeSymbol)
-    assert to_str(parsed) == 'some_type%val'
+    assert _to_str(parsed) == 'some_type%val'
     parsed = parse_expr(convert_to_case('-some_type%val', mode=case))
     assert isinstance(parsed, sym.Product)
     assert isinstance(parsed.children[1].parent, sym.DeferredTypeSymbol)
-    assert to_str(parsed) == '-some_type%val'
+    assert _to_str(parsed) == '-some_type%val'
     parsed = parse_expr(convert_to_case('some_type%another_type%val', mode=case))
     assert isinstance(parsed, sym.DeferredTypeSymbol)
     assert isinstance(parsed.parent, sym.DeferredTypeSymbol)
     assert isinstance(parsed.parent.parent, sym.DeferredTypeSymbol)
-    assert to_str(parsed) == 'some_type%another_type%val'
+    assert _to_str(parsed) == 'some_type%another_type%val'
     parsed = parse_expr(convert_to_case('some_type%arr(a, b)', mode=case))
     assert isinstance(parsed, sym.Array)
     assert isinstance(parsed.parent, sym.DeferredTypeSymbol)
-    assert to_str(parsed) == 'some_type%arr(a,b)'
+    assert _to_str(parsed) == 'some_type%arr(a,b)'
     parsed = parse_expr(convert_to_case('some_type%some_func()', mode=case))
     assert isinstance(parsed, sym.InlineCall)
     assert isinstance(parsed.function.parent, sym.DeferredTypeSymbol)
-    assert to_str(parsed) == 'some_type%some_func()'
+    assert _to_str(parsed) == 'some_type%some_func()'
 
     parsed = parse_expr(convert_to_case('"some_string_literal 42 _-*"', mode=case))
     assert isinstance(parsed, sym.StringLiteral)
     assert parsed.value.lower() == 'some_string_literal 42 _-*'
-    assert to_str(parsed) == "'some_string_literal42_-*'"
+    assert _to_str(parsed) == "'some_string_literal42_-*'"
 
     parsed = parse_expr(convert_to_case("'some_string_literal 42 _-*'", mode=case))
     assert isinstance(parsed, sym.StringLiteral)
     assert parsed.value.lower() == 'some_string_literal 42 _-*'
-    assert to_str(parsed) == "'some_string_literal42_-*'"
+    assert _to_str(parsed) == "'some_string_literal42_-*'"
 
     parsed = parse_expr(convert_to_case('MODULO(A, B)', mode=case), scope=routine)
     assert isinstance(parsed, sym.InlineCall)
     assert all(isinstance(_parsed,  sym.Scalar) for _parsed in parsed.parameters)
     assert all(_parsed.scope == routine for _parsed in parsed.parameters)
-    assert to_str(parsed) == 'modulo(a,b)'
+    assert _to_str(parsed) == 'modulo(a,b)'
 
     parsed = parse_expr(convert_to_case('a .and. b', mode=case))
     assert isinstance(parsed, sym.LogicalAnd)
     assert all(isinstance(_parsed,  sym.DeferredTypeSymbol) for _parsed in parsed.children)
-    assert to_str(parsed) == 'aandb'
+    assert _to_str(parsed) == 'aandb'
     parsed = parse_expr(convert_to_case('a .and. b', mode=case), scope=routine)
     assert isinstance(parsed, sym.LogicalAnd)
     assert all(isinstance(_parsed,  sym.Scalar) for _parsed in parsed.children)
     assert all(_parsed.scope == routine for _parsed in parsed.children)
-    assert to_str(parsed) == 'aandb'
+    assert _to_str(parsed) == 'aandb'
     parsed = parse_expr(convert_to_case('a .or. b', mode=case))
     assert isinstance(parsed, sym.LogicalOr)
     assert all(isinstance(_parsed,  sym.DeferredTypeSymbol) for _parsed in parsed.children)
-    assert to_str(parsed) == 'aorb'
+    assert _to_str(parsed) == 'aorb'
     parsed = parse_expr(convert_to_case('a .or. .not. b', mode=case))
     assert isinstance(parsed, sym.LogicalOr)
     assert isinstance(parsed.children[0], sym.DeferredTypeSymbol)
     assert isinstance(parsed.children[1], sym.LogicalNot)
-    assert to_str('aornotb')
+    assert _to_str(parsed) == 'aornotb'
 
     parsed = parse_expr(convert_to_case('((a + b)/(a - b))**3 + 3.1415', mode=case), scope=routine)
     assert isinstance(parsed, sym.Sum)
@@ -1954,73 +1927,86 @@ end module external_mod
     assert isinstance(parsed.children[0].base.numerator, sym.Sum)
     assert isinstance(parsed.children[0].base.denominator, sym.Sum)
     assert isinstance(parsed.children[1], sym.FloatLiteral)
-    parsed_vars = FindVariables().visit(parsed)
+    parsed_vars = _FIND_VARIABLES.visit(parsed)
     assert parsed_vars == ('a', 'b', 'a', 'b')
     assert all(parsed_var.scope == routine for parsed_var in parsed_vars)
-    assert to_str(parsed) == '((a+b)/(a-b))**3+3.1415'
+    assert _to_str(parsed) == '((a+b)/(a-b))**3+3.1415'
 
     parsed = parse_expr(convert_to_case('call_with_kwargs(a, val=7, end=b)', mode=case))
     assert isinstance(parsed, sym.InlineCall)
     assert parsed.parameters == ('a',)
     assert parsed.kw_parameters == {'val': 7, 'end': 'b'}
-    assert to_str(parsed) == 'call_with_kwargs(a,val=7,end=b)'
+    assert _to_str(parsed) == 'call_with_kwargs(a,val=7,end=b)'
 
     parsed = parse_expr(convert_to_case('real(6, kind=jprb)', mode=case))
     assert isinstance(parsed, sym.Cast)
     assert parsed.name.lower() == 'real'
     assert all(isinstance(_parsed, sym.IntLiteral) for _parsed in parsed.parameters)
     assert parsed.kind.name.lower() == 'jprb'
-    assert to_str(parsed) == 'real(6)'
+    assert _to_str(parsed) == 'real(6)'
 
     parsed = parse_expr(convert_to_case('2.4', mode=case))
     assert isinstance(parsed, sym.FloatLiteral)
     assert parsed.kind is None
-    assert to_str(parsed) == '2.4'
+    assert _to_str(parsed) == '2.4'
 
     parsed = parse_expr(convert_to_case('2.4_jprb', mode=case), scope=routine)
     assert isinstance(parsed, sym.FloatLiteral)
     assert parsed.kind == 'jprb'
-    assert to_str(parsed) == '2.4_jprb'
+    assert _to_str(parsed) == '2.4_jprb'
 
     parsed = parse_expr(convert_to_case('2._8', mode=case), scope=routine)
     assert isinstance(parsed, sym.FloatLiteral)
     assert parsed.kind == '8'
     assert float(parsed.value) == 2.0
-    assert to_str(parsed) == '2._8'
+    assert _to_str(parsed) == '2._8'
 
     parsed = parse_expr(convert_to_case('2.4e18_my_kind8', mode=case), scope=routine)
     assert isinstance(parsed, sym.FloatLiteral)
     assert parsed.kind == 'my_kind8'
     assert float(parsed.value) == 2.4e18
-    assert to_str(parsed) == '2.4e18_my_kind8'
+    assert _to_str(parsed) == '2.4e18_my_kind8'
 
     parsed = parse_expr(convert_to_case('4_jpim', mode=case), scope=routine)
     assert isinstance(parsed, sym.IntLiteral)
     assert parsed.kind == 'jpim'
     assert int(parsed.value) == 4
-    assert to_str(parsed) == '4'
+    assert _to_str(parsed) == '4'
 
     parsed = parse_expr(convert_to_case('[1, 2, 3, 4]', mode=case), scope=routine)
     assert isinstance(parsed, sym.LiteralList)
     assert all(isinstance(_parsed, sym.IntLiteral) for _parsed in parsed.elements)
-    assert to_str(parsed) == '[1,2,3,4]'
+    assert _to_str(parsed) == '[1,2,3,4]'
     parsed = parse_expr(convert_to_case('(/ 2, 3, 4, 5 /)', mode=case), scope=routine)
     assert isinstance(parsed, sym.LiteralList)
     assert all(isinstance(_parsed, sym.IntLiteral) for _parsed in parsed.elements)
-    assert to_str(parsed) == '[2,3,4,5]'
+    assert _to_str(parsed) == '[2,3,4,5]'
 
     parsed = parse_expr(convert_to_case('.TRUE.', mode=case))
     assert isinstance(parsed, sym.LogicLiteral)
     assert parsed.value is True
-    assert to_str(parsed) == 'true'
+    assert _to_str(parsed) == 'true'
 
     parsed = parse_expr(convert_to_case('.FALSE.', mode=case))
     assert isinstance(parsed, sym.LogicLiteral)
     assert parsed.value is False
-    assert to_str(parsed) == 'false'
+    assert _to_str(parsed) == 'false'
 
     parsed = parse_expr(convert_to_case('.FALSE. .OR. .TRUE. .AND. .TRUE.', mode=case))
-    assert to_str(parsed) == 'falseortrueandtrue'
+    assert _to_str(parsed) == 'falseortrueandtrue'
+
+
+@pytest.mark.parametrize('case', ('upper', 'lower', 'random'))
+@pytest.mark.parametrize('expr_str,operator', _COMPARISON_EXPRESSIONS)
+def test_expression_parser_comparison(frontend, case, expr_str, operator):
+    routine = _cached_subroutine(_FCODE_PARSER_ROUTINE, frontend, clone=False)
+
+    parsed = parse_expr(convert_to_case(expr_str, mode=case), scope=routine)
+    assert parsed.operator == operator
+    assert isinstance(parsed, sym.Comparison)
+    assert all(isinstance(_parsed,  sym.Scalar) for _parsed in [parsed.left, parsed.right])
+    assert all(_parsed.scope == routine for _parsed in [parsed.left, parsed.right])
+    assert _to_str(parsed) == f'a{operator}b'
 
 
 @pytest.mark.parametrize('case', ('upper', 'lower', 'random'))
@@ -2115,7 +2101,7 @@ def test_expression_parser_evaluate(case):
     with pytest.raises(pmbl_mapper.evaluator.UnknownVariableError):
         parsed = parse_expr(convert_to_case(f'{test_str}', mode=case), evaluate=True, strict=True, context=context)
     parsed = parse_expr(convert_to_case(f'{test_str}', mode=case), evaluate=True, strict=False, context=context)
-    assert str(parsed).lower().replace(' ', '') == '8+some_func(6,10)'
+    assert _to_str(parsed) == '8+some_func(6,10)'
 
     def some_func(a, b, c=None):
         if c is None:
@@ -2135,7 +2121,7 @@ def test_expression_parser_evaluate(case):
     context = {'a': 6, 'b': 7}
     test_str = '(a + b + c + 1)/(c + 1)'
     parsed = parse_expr(convert_to_case(f'{test_str}', mode=case), evaluate=True, context=context)
-    assert str(parsed).lower().replace(' ', '') == '(13+c+1)/(c+1)'
+    assert _to_str(parsed) == '(13+c+1)/(c+1)'
 
     class BarBarBar:
         val_barbarbar = 5
@@ -2168,14 +2154,14 @@ def test_expression_parser_evaluate(case):
     context = {'foo': Foo(2, 3)}
     test_str = 'foo%val1 + foo%val2 + foo%val3'
     parsed = parse_expr(convert_to_case(f'{test_str}', mode=case))
-    assert str(parsed).lower().replace(' ', '') == 'foo%val1+foo%val2+foo%val3'
+    assert _to_str(parsed) == 'foo%val1+foo%val2+foo%val3'
     with pytest.raises(pmbl_mapper.evaluator.UnknownVariableError):
         parsed = parse_expr(convert_to_case(f'{test_str}', mode=case), evaluate=True, strict=True)
     parsed = parse_expr(convert_to_case(f'{test_str}', mode=case), evaluate=True, context=context)
     assert parsed == 6
     test_str = 'foo%val1 + foo%some_func(1, 2) + foo%static_func_2(3)'
     parsed = parse_expr(convert_to_case(f'{test_str}', mode=case), evaluate=True, context=context)
-    assert str(parsed).lower().replace(' ', '') == '5+foo%static_func_2(3)'
+    assert _to_str(parsed) == '5+foo%static_func_2(3)'
     with pytest.raises(pmbl_mapper.evaluator.UnknownVariableError):
         parsed = parse_expr(convert_to_case(f'{test_str}', mode=case), evaluate=True, strict=True)
     test_str = 'foo%val1 + foo%some_func(1, 2) + foo%static_func(3) + foo%arr(1, 2)'
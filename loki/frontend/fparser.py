@@ -1853,10 +1853,17 @@ class FParser2IR(GenericVisitor):
 
         # Once statement functions are in place, we need to update the original declaration so that it
         # contains ProcedureSymbols rather than Scalars
-        for decl in FindNodes(ir.VariableDeclaration).visit(spec):
-            if any(routine.symbol_attrs[s.name].is_stmt_func for s in decl.symbols):
-                decl._update(symbols=tuple(s.clone() if routine.symbol_attrs[s.name].is_stmt_func else s
-                                           for s in decl.symbols))
+        # A single walk over the spec finds both, and the declarations only need to
+        # be inspected if there are any statement functions at all
+        spec_nodes = FindNodes((ir.VariableDeclaration, ir.StatementFunction)).visit(spec)
+        if any(isinstance(node, ir.StatementFunction) for node in spec_nodes):
+            for decl in spec_nodes:
+                if not isinstance(decl, ir.VariableDeclaration):
+                    continue
+                is_stmt_func = [routine.symbol_attrs[s.name].is_stmt_func for s in decl.symbols]
+                if any(is_stmt_func):
+                    decl._update(symbols=tuple(s.clone() if stmt_func else s
+                                               for s, stmt_func in zip(decl.symbols, is_stmt_func)))
 
         # For deferred array dimensions on allocatables, we infer the conceptual
         # dimension by finding any `allocate(var(<dims>))` statements.
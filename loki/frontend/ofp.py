@@ -76,9 +76,12 @@ def parse_ofp_source(source, filepath=None):
     # Always store intermediate flies in tmp dir
     filepath = gettempdir()/filepath.name
 
-    debug(f'[Loki::OFP] Writing temporary source {filepath}')
-    with filepath.open('w') as f:
-        f.write(source)
+    # Leave an identical temporary source untouched, so that its timestamp
+    # does not invalidate the disk cache of :any:`parse_ofp_file`
+    if not filepath.exists() or filepath.read_text() != source:
+        debug(f'[Loki::OFP] Writing temporary source {filepath}')
+        with filepath.open('w') as f:
+            f.write(source)
 
     return parse_ofp_file(filename=filepath)
 
@@ -118,7 +121,8 @@ class OFP2IR(GenericVisitor):
     def __init__(self, raw_source, definitions=None, pp_info=None, scope=None):
         super().__init__()
 
-        self._raw_source = raw_source
+        # Split the source once, rather than for every extracted snippet
+        self._raw_source = raw_source.splitlines(keepends=True)
         self.definitions = CaseInsensitiveDict((d.name, d) for d in as_tuple(definitions))
         self.pp_info = pp_info
         self.default_scope = scope
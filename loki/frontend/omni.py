@@ -67,7 +67,9 @@ def parse_omni_file(filename, xmods=None):
         execute(cmd)
         return ET.parse(str(xml_path)).getroot()
 
-    result = execute(cmd, silent=False, capture_output=True, text=True)
+    # Hand the raw bytes to the XML parser, which decodes them according to
+    # the encoding declared by F_Front instead of the locale's default
+    result = execute(cmd, silent=False, capture_output=True)
     return ET.fromstring(result.stdout)
 
 
@@ -112,15 +114,29 @@ class OMNI2IR(GenericVisitor):
     # pylint: disable=unused-argument  # Stop warnings about unused arguments
 
     _omni_types = {
-        'Fint': 'INTEGER',
-        'Freal': 'REAL',
-        'Flogical': 'LOGICAL',
-        'Fcharacter': 'CHARACTER',
-        'Fcomplex': 'COMPLEX',
-        'int': 'INTEGER',
-        'real': 'REAL',
+        'Fint': BasicType.INTEGER,
+        'Freal': BasicType.REAL,
+        'Flogical': BasicType.LOGICAL,
+        'Fcharacter': BasicType.CHARACTER,
+        'Fcomplex': BasicType.COMPLEX,
+        'int': BasicType.INTEGER,
+        'real': BasicType.REAL,
     }
 
+    _expression_tags = frozenset((
+        'plusExpr', 'minusExpr', 'mulExpr', 'divExpr', 'FpowerExpr', 'unaryMinusExpr',
+        'logOrExpr', 'logAndExpr', 'logNotExpr', 'logLTExpr', 'logLEExpr', 'logGTExpr',
+        'logGEExpr', 'logEQExpr', 'logNEQExpr', 'logEQVExpr', 'logNEQVExpr', 'FconcatExpr',
+        'FintConstant', 'FrealConstant', 'FlogicalConstant', 'FcharacterConstant',
+        'FcomplexConstant', 'FarrayConstructor', 'FstructConstructor',
+        'Var', 'name', 'varRef', 'FmemberRef', 'FarrayRef', 'FcharacterRef',
+        'arrayIndex', 'indexRange', 'lowerBound', 'upperBound', 'step'
+    ))
+    """
+    Tags of expression nodes, whose handlers do not make use of the
+    :any:`Source` object that :meth:`visit` provides
+    """
+
     def __init__(self, definitions=None, type_map=None, symbol_map=None,
                  raw_source=None, scope=None):
         super().__init__()
@@ -131,6 +147,7 @@ class OMNI2IR(GenericVisitor):
         self.raw_source = raw_source.splitlines(keepends=True)
         self.default_scope = scope
         self.lineno = None  # use to save lineno of last element with attribute lineno
+        self._tag_handlers = {}  # resolved handler for each XML tag encountered
 
     @staticmethod
     def warn_or_fail(msg):
@@ -144,8 +161,7 @@ class OMNI2IR(GenericVisitor):
         Helper routine to derive :any:`SymbolAttributes` for a given type name/hash/id
         """
         if type_attrib in self._omni_types:
-            typename = self._omni_types[type_attrib]
-            _type = SymbolAttributes(BasicType.from_fortran_type(typename))
+            _type = SymbolAttributes(self._omni_types[type_attrib])
         elif type_attrib in self.type_map:
             _type = self.visit(self.type_map[type_attrib], **kwargs)
             dims = self.type_map[type_attrib].findall('indexRange')
@@ -160,10 +176,17 @@ class OMNI2IR(GenericVisitor):
         """
         Alternative lookup method for XML element types, identified by ``element.tag``
         """
-        tag = instance.tag.replace('-', '_')
-        if tag in self._handlers:
-            return self._handlers[tag]
-        return super().lookup_method(instance)
+        try:
+            return self._tag_handlers[instance.tag]
+        except KeyError:
+            tag = instance.tag.replace('-', '_')
+            if tag in self._handlers:
+                handler = self._handlers[tag]
+            else:
+                handler = super().lookup_method(instance)
+            # Save it on the original tag for faster lookup next time
+            self._tag_handlers[instance.tag] = handler
+            return handler
 
     def get_source(self, o):
         """Helper method that builds the source object for a node"""
@@ -182,7 +205,10 @@ class OMNI2IR(GenericVisitor):
         """
         Generic dispatch method that tries to generate meta-data from source.
         """
-        kwargs['source'] = self.get_source(o)
+        if o.tag in self._expression_tags and 'lineno' not in o.attrib:
+            kwargs['source'] = None
+        else:
+            kwargs['source'] = self.get_source(o)
         kwargs.setdefault('scope', self.default_scope)
         kwargs.setdefault('symbol_map', self.symbol_map)
         return super().visit(o, **kwargs)
@@ -191,9 +217,8 @@ class OMNI2IR(GenericVisitor):
         """
         Universal default for XML element types
         """
-        warning('No specific handler for node type %s', o.__class__.name)
-        children = tuple(self.visit(c, **kwargs) for c in o)
-        children = tuple(c for c in children if c is not None)
+        warning('No specific handler for node type %s', o.tag)
+        children = tuple(c for c in (self.visit(c, **kwargs) for c in o) if c is not None)
         if len(children) == 1:
             return children[0]  # Flatten hierarchy if possible
         return children if len(children) > 0 else None
@@ -522,13 +547,11 @@ class OMNI2IR(GenericVisitor):
         return module
 
     def visit_declarations(self, o, **kwargs):
-        body = tuple(self.visit(c, **kwargs) for c in o)
-        body = tuple(c for c in body if c is not None)
+        body = tuple(c for c in (self.visit(c, **kwargs) for c in o) if c is not None)
         return ir.Section(body=body, source=kwargs['source'])
 
     def visit_body(self, o, **kwargs):
-        body = tuple(self.visit(c, **kwargs) for c in o)
-        body = tuple(c for c in body if c is not None)
+        body = tuple(c for c in (self.visit(c, **kwargs) for c in o) if c is not None)
         return body
 
     def visit_FimportDecl(self, o, **kwargs):
@@ -546,8 +569,7 @@ class OMNI2IR(GenericVisitor):
         # Create the declared type
         if name.attrib['type'] in self._omni_types:
             # Intrinsic scalar type
-            t = self._omni_types[name.attrib['type']]
-            _type = SymbolAttributes(BasicType.from_fortran_type(t))
+            _type = SymbolAttributes(self._omni_types[name.attrib['type']])
             dimensions = None
 
         elif name.attrib['type'] in self.type_map:
@@ -579,8 +601,9 @@ class OMNI2IR(GenericVisitor):
             raise ValueError
 
         scope = kwargs['scope']
-        if o.find('value') is not None:
-            _type = _type.clone(initial=AttachScopesMapper()(self.visit(o.find('value'), **kwargs), scope=scope))
+        value = o.find('value')
+        if value is not None:
+            _type = _type.clone(initial=AttachScopesMapper()(self.visit(value, **kwargs), scope=scope))
         if _type.kind is not None:
             _type = _type.clone(kind=AttachScopesMapper()(_type.kind, scope=scope))
 
@@ -635,8 +658,9 @@ class OMNI2IR(GenericVisitor):
             body += [ir.Intrinsic('SEQUENCE')]
 
         # Build the list of derived type members and individual body for each
-        if struct_type.find('symbols'):
-            variables = self.visit(struct_type.find('symbols'), **kwargs)
+        symbols = struct_type.find('symbols')
+        if symbols:
+            variables = self.visit(symbols, **kwargs)
             for v in variables:
                 if isinstance(v.type.dtype, ProcedureType):
                     if v.type.dtype.name == v and v.type.dtype.is_function:
@@ -648,12 +672,13 @@ class OMNI2IR(GenericVisitor):
                 else:
                     body += [ir.VariableDeclaration(symbols=(v,))]
 
-        if struct_type.find('typeBoundProcedures'):
+        type_bound_procedures = struct_type.find('typeBoundProcedures')
+        if type_bound_procedures:
             # See if components are marked private
             body += [ir.Intrinsic('CONTAINS')]
             if struct_type.attrib.get('is_internal_private') == 'true':
                 body += [ir.Intrinsic('PRIVATE')]
-            body += self.visit(struct_type.find('typeBoundProcedures'), **kwargs)
+            body += self.visit(type_bound_procedures, **kwargs)
 
         # Finally: update the typedef with its body
         typedef._update(body=as_tuple(body))
@@ -710,8 +735,9 @@ class OMNI2IR(GenericVisitor):
         if o.get('is_public') == 'true':
             _type = _type.clone(public=True)
 
-        if o.find('binding'):
-            bind_name = self.visit(o.find('binding/name'), **kwargs)
+        binding = o.find('binding')
+        if binding:
+            bind_name = self.visit(binding.find('name'), **kwargs)
             bind_name_scope = scope.get_symbol_scope(bind_name.name)
 
             # Set correct type for interface/binding
@@ -773,8 +799,7 @@ class OMNI2IR(GenericVisitor):
         return ir.DataDeclaration(variable=variable, values=values, source=kwargs['source'])
 
     def visit_varList(self, o, **kwargs):
-        children = tuple(self.visit(c, **kwargs) for c in o)
-        children = tuple(c for c in children if c is not None)
+        children = tuple(c for c in (self.visit(c, **kwargs) for c in o) if c is not None)
         return children
 
     visit_valueList = visit_varList
@@ -782,8 +807,9 @@ class OMNI2IR(GenericVisitor):
     def visit_FbasicType(self, o, **kwargs):
         ref = o.attrib.get('ref', None)
         if ref in self._omni_types:
-            dtype = BasicType.from_fortran_type(self._omni_types[ref])
-            kind = self.visit(o.find('kind'), **kwargs) if o.find('kind') is not None else None
+            dtype = self._omni_types[ref]
+            kind = o.find('kind')
+            kind = self.visit(kind, **kwargs) if kind is not None else None
             length = o.find('len')
             if length is not None:
                 if length == '*':
@@ -796,8 +822,9 @@ class OMNI2IR(GenericVisitor):
                     length = self.visit(length, **kwargs)
             _type = SymbolAttributes(dtype, kind=kind, length=length)
         elif ref in self.type_map:
-            if o.find('name') is not None:
-                _type = self.visit(self.type_map[ref], name=o.find('name').text, **kwargs)
+            name = o.find('name')
+            if name is not None:
+                _type = self.visit(self.type_map[ref], name=name.text, **kwargs)
             else:
                 _type = self.visit(self.type_map[ref], **kwargs)
             if o.attrib.get('is_class') == 'true':
@@ -838,7 +865,7 @@ class OMNI2IR(GenericVisitor):
         if o.attrib['return_type'] == 'Fvoid':
             return_type = None
         elif o.attrib['return_type'] in self._omni_types:
-            return_type = SymbolAttributes(BasicType.from_fortran_type(self._omni_types[o.attrib['return_type']]))
+            return_type = SymbolAttributes(self._omni_types[o.attrib['return_type']])
         elif o.attrib['return_type'] in self.type_map:
             return_type = self.visit(self.type_map[o.attrib['return_type']], **kwargs)
         else:
@@ -932,8 +959,7 @@ class OMNI2IR(GenericVisitor):
         return ir.Comment(text=o.text, source=kwargs['source'])
 
     def visit_FpragmaStatement(self, o, **kwargs):
-        keyword = o.text.split(' ')[0]
-        content = ' '.join(o.text.split(' ')[1:])
+        keyword, _, content = o.text.partition(' ')
         return ir.Pragma(keyword=keyword, content=content, source=kwargs['source'])
 
     def visit_FassignStatement(self, o, **kwargs):
@@ -944,11 +970,8 @@ class OMNI2IR(GenericVisitor):
     def visit_FallocateStatement(self, o, **kwargs):
         variables = tuple(self.visit(c, **kwargs) for c in o.findall('alloc'))
 
-        alloc_opts = {}
-        if o.find('allocOpt') is not None:
-            alloc_opts = [self.visit(opt, **kwargs) for opt in o.findall('allocOpt')]
-            alloc_opts = [opt for opt in alloc_opts if opt is not None]
-            alloc_opts = dict(alloc_opts)
+        alloc_opts = [self.visit(opt, **kwargs) for opt in o.findall('allocOpt')]
+        alloc_opts = dict(opt for opt in alloc_opts if opt is not None)
 
         return ir.Allocation(variables=variables, source=kwargs['source'],
                              data_source=alloc_opts.get('source'), status_var=alloc_opts.get('stat'))
@@ -963,11 +986,8 @@ class OMNI2IR(GenericVisitor):
     def visit_FdeallocateStatement(self, o, **kwargs):
         variables = tuple(self.visit(c, **kwargs) for c in o.findall('alloc'))
 
-        alloc_opts = {}
-        if o.find('allocOpt') is not None:
-            alloc_opts = [self.visit(opt, **kwargs) for opt in o.findall('allocOpt')]
-            alloc_opts = [opt for opt in alloc_opts if opt is not None]
-            alloc_opts = dict(alloc_opts)
+        alloc_opts = [self.visit(opt, **kwargs) for opt in o.findall('allocOpt')]
+        alloc_opts = dict(opt for opt in alloc_opts if opt is not None)
 
         return ir.Deallocation(variables=variables, source=kwargs['source'],
                                status_var=alloc_opts.get('stat'))
@@ -978,16 +998,17 @@ class OMNI2IR(GenericVisitor):
 
     def visit_alloc(self, o, **kwargs):
         variable = self.visit(o[0], **kwargs)
-        if o.find('arrayIndex') is not None:
-            dimensions = tuple(self.visit(c, **kwargs) for c in o.findall('arrayIndex'))
+        dimensions = tuple(self.visit(c, **kwargs) for c in o.findall('arrayIndex'))
+        if dimensions:
             variable = variable.clone(dimensions=dimensions)
         return variable
 
     def visit_FwhereStatement(self, o, **kwargs):
         conditions = tuple(self.visit(c, **kwargs) for c in o.findall('condition'))
         bodies = tuple(self.visit(b, **kwargs) for b in o.findall('then/body'))
-        if o.find('else') is not None:
-            default = self.visit(o.find('else/body'), **kwargs)
+        else_ast = o.find('else')
+        if else_ast is not None:
+            default = self.visit(else_ast.find('body'), **kwargs)
         else:
             default = ()
         return ir.MaskedStatement(conditions=conditions, bodies=bodies, default=default, source=kwargs['source'])
@@ -998,22 +1019,26 @@ class OMNI2IR(GenericVisitor):
         return ir.Assignment(lhs=target, rhs=expr, ptr=True, source=kwargs['source'])
 
     def visit_FdoWhileStatement(self, o, **kwargs):
-        assert o.find('condition') is not None
-        assert o.find('body') is not None
-        condition = self.visit(o.find('condition'), **kwargs)
-        body = self.visit(o.find('body'), **kwargs)
+        condition, body = o.find('condition'), o.find('body')
+        assert condition is not None
+        assert body is not None
+        condition = self.visit(condition, **kwargs)
+        body = self.visit(body, **kwargs)
         return ir.WhileLoop(condition=condition, body=body, source=kwargs['source'])
 
     def visit_FdoStatement(self, o, **kwargs):
-        assert o.find('body') is not None
-        body = self.visit(o.find('body'), **kwargs)
-        if o.find('Var') is None:
+        body = o.find('body')
+        assert body is not None
+        body = self.visit(body, **kwargs)
+        variable = o.find('Var')
+        if variable is None:
             # We are in an unbound do loop
             return ir.WhileLoop(condition=None, body=body, source=kwargs['source'])
-        variable = self.visit(o.find('Var'), **kwargs)
-        lower = self.visit(o.find('indexRange/lowerBound'), **kwargs)
-        upper = self.visit(o.find('indexRange/upperBound'), **kwargs)
-        step = self.visit(o.find('indexRange/step'), **kwargs)
+        variable = self.visit(variable, **kwargs)
+        index_range = o.find('indexRange')
+        lower = self.visit(index_range.find('lowerBound'), **kwargs)
+        upper = self.visit(index_range.find('upperBound'), **kwargs)
+        step = self.visit(index_range.find('step'), **kwargs)
         # Drop OMNI's `:1` step counting for ranges in the name of consistency
         step = None if step == '1' else step
         bounds = sym.LoopRange((lower, upper, step))
@@ -1021,9 +1046,10 @@ class OMNI2IR(GenericVisitor):
 
     def visit_FdoLoop(self, o, **kwargs):
         variable = self.visit(o.find('Var'), **kwargs)
-        lower = self.visit(o.find('indexRange/lowerBound'), **kwargs)
-        upper = self.visit(o.find('indexRange/upperBound'), **kwargs)
-        step = self.visit(o.find('indexRange/step'), **kwargs)
+        index_range = o.find('indexRange')
+        lower = self.visit(index_range.find('lowerBound'), **kwargs)
+        upper = self.visit(index_range.find('upperBound'), **kwargs)
+        step = self.visit(index_range.find('step'), **kwargs)
         # Drop OMNI's `:1` step counting for ranges in the name of consistency
         step = None if step == '1' else step
         bounds = sym.LoopRange((lower, upper, step))
@@ -1033,8 +1059,9 @@ class OMNI2IR(GenericVisitor):
     def visit_FifStatement(self, o, **kwargs):
         condition = self.visit(o.find('condition'), **kwargs)
         body = self.visit(o.find('then/body'), **kwargs)
-        if o.find('else'):
-            else_body = self.visit(o.find('else/body'), **kwargs)
+        else_ast = o.find('else')
+        if else_ast:
+            else_body = self.visit(else_ast.find('body'), **kwargs)
         else:
             else_body = ()
         return ir.Conditional(condition=condition, body=body, else_body=else_body, source=kwargs['source'])
@@ -1043,33 +1070,37 @@ class OMNI2IR(GenericVisitor):
         return self.visit(o[0], **kwargs)
 
     def visit_FselectCaseStatement(self, o, **kwargs):
-        expr = self.visit(o.find('value'), **kwargs)
-        cases = tuple(self.visit(case, **kwargs) for case in o.findall('FcaseLabel'))
-        values, bodies = zip(*cases)
-        if None in values:
-            else_index = values.index(None)
-            else_body = as_tuple(bodies[else_index])
-            values = values[:else_index] + values[else_index+1:]
-            bodies = bodies[:else_index] + bodies[else_index+1:]
-        else:
-            else_body = ()
-
-        # Retain comments before the first case
-        value_idx, case_idx = list(o).index(o.find('value')), list(o).index(o.find('FcaseLabel'))
-        pre = as_tuple(self.visit(c, **kwargs) for c in o[value_idx+1:case_idx])
+        # Partition the children in a single pass, retaining comments
+        # between the selector and the first case
+        expr, in_cases = None, False
+        pre, values, bodies, else_body = [], [], [], ()
+        for c in o:
+            if c.tag == 'FcaseLabel':
+                in_cases = True
+                case_values, case_body = self.visit(c, **kwargs)
+                if case_values is None:
+                    else_body = case_body
+                else:
+                    values += [case_values]
+                    bodies += [case_body]
+            elif expr is None:
+                if c.tag == 'value':
+                    expr = self.visit(c, **kwargs)
+            elif not in_cases:
+                pre += [self.visit(c, **kwargs)]
 
         return (
             *pre,
-            ir.MultiConditional(expr=expr, values=values, bodies=bodies, else_body=else_body,
+            ir.MultiConditional(expr=expr, values=tuple(values), bodies=tuple(bodies), else_body=else_body,
                                 source=kwargs['source'])
         )
 
     def visit_FcaseLabel(self, o, **kwargs):
-        values = [self.visit(value, **kwargs) for value in list(o) if value.tag in ('value', 'indexRange')]
+        values = [self.visit(value, **kwargs) for value in o if value.tag in ('value', 'indexRange')]
         if not values:
             values = None
         elif len(values) == 1:
-            values = values.pop()
+            values = values[0]
         body = self.visit(o.find('body'), **kwargs)
         return as_tuple(values) or None, as_tuple(body)
 
@@ -1156,7 +1187,7 @@ class OMNI2IR(GenericVisitor):
         return sym.Literal(value=int(o.text), type=BasicType.INTEGER)
 
     def visit_FcomplexConstant(self, o, **kwargs):
-        value = ', '.join(f'{self.visit(v, **kwargs)}' for v in list(o))
+        value = ', '.join(f'{self.visit(v, **kwargs)}' for v in o)
         return sym.IntrinsicLiteral(value=f'({value})')
 
     def visit_FarrayConstructor(self, o, **kwargs):
@@ -1168,12 +1199,12 @@ class OMNI2IR(GenericVisitor):
         return sym.LiteralList(values=values, dtype=dtype)
 
     def visit_functionCall(self, o, **kwargs):
-        if o.find('name') is not None:
-            name = self.visit(o.find('name'), **kwargs)
-        elif o.find('FmemberRef') is not None:
-            name = self.visit(o.find('FmemberRef'), **kwargs)
-        else:
+        name = o.find('name')
+        if name is None:
+            name = o.find('FmemberRef')
+        if name is None:
             raise ValueError
+        name = self.visit(name, **kwargs)
 
         args = o.find('arguments')
         if args is not None:
@@ -1225,33 +1256,41 @@ class OMNI2IR(GenericVisitor):
         # TODO: do-construct-name is not preserved
         return ir.Intrinsic(text='exit', source=kwargs['source'])
 
+    def named_value_args(self, o, **kwargs):
+        """
+        Render the entries of the ``namedValueList`` of an IO statement as
+        a string of keyword arguments
+        """
+        nvalues = (self.visit(nv, **kwargs) for nv in o.find('namedValueList'))
+        return ', '.join(f'{k}={v}' for k, v in nvalues)
+
+    def value_args(self, o, **kwargs):
+        """
+        Render the entries of the ``valueList`` of an IO statement as a
+        string of arguments
+        """
+        return ', '.join(str(self.visit(v, **kwargs)) for v in o.find('valueList'))
+
     def visit_FopenStatement(self, o, **kwargs):
-        nvalues = [self.visit(nv, **kwargs) for nv in o.find('namedValueList')]
-        nargs = ', '.join(f'{k}={v}' for k, v in nvalues)
+        nargs = self.named_value_args(o, **kwargs)
         return ir.Intrinsic(text=f'open({nargs})', source=kwargs['source'])
 
     def visit_FcloseStatement(self, o, **kwargs):
-        nvalues = [self.visit(nv, **kwargs) for nv in o.find('namedValueList')]
-        nargs = ', '.join(f'{k}={v}' for k, v in nvalues)
+        nargs = self.named_value_args(o, **kwargs)
         return ir.Intrinsic(text=f'close({nargs})', source=kwargs['source'])
 
     def visit_FreadStatement(self, o, **kwargs):
-        nvalues = [self.visit(nv, **kwargs) for nv in o.find('namedValueList')]
-        values = [self.visit(v, **kwargs) for v in o.find('valueList')]
-        nargs = ', '.join(f'{k}={v}' for k, v in nvalues)
-        args = ', '.join(f'{v}' for v in values)
+        nargs = self.named_value_args(o, **kwargs)
+        args = self.value_args(o, **kwargs)
         return ir.Intrinsic(text=f'read({nargs}) {args}', source=kwargs['source'])
 
     def visit_FwriteStatement(self, o, **kwargs):
-        nvalues = [self.visit(nv, **kwargs) for nv in o.find('namedValueList')]
-        values = [self.visit(v, **kwargs) for v in o.find('valueList')]
-        nargs = ', '.join(f'{k}={v}' for k, v in nvalues)
-        args = ', '.join(f'{v}' for v in values)
+        nargs = self.named_value_args(o, **kwargs)
+        args = self.value_args(o, **kwargs)
         return ir.Intrinsic(text=f'write({nargs}) {args}', source=kwargs['source'])
 
     def visit_FprintStatement(self, o, **kwargs):
-        values = [self.visit(v, **kwargs) for v in o.find('valueList')]
-        args = ', '.join(f'{v}' for v in values)
+        args = self.value_args(o, **kwargs)
         fmt = o.attrib['format']
         return ir.Intrinsic(text=f'print {fmt}, {args}', source=kwargs['source'])
 
@@ -1263,7 +1302,7 @@ class OMNI2IR(GenericVisitor):
         name = o.attrib['name']
         if 'value' in o.attrib:
             return name, o.attrib['value']
-        return name, self.visit(list(o)[0], **kwargs)
+        return name, self.visit(o[0], **kwargs)
 
     @staticmethod
     def parenthesize_if_needed(expr, enclosing_cls):
@@ -1329,35 +1368,25 @@ class OMNI2IR(GenericVisitor):
         assert len(exprs) == 1
         return sym.LogicalNot(exprs[0])
 
-    def visit_logLTExpr(self, o, **kwargs):
-        exprs = tuple(self.visit(c, **kwargs) for c in o)
-        assert len(exprs) == 2
-        return sym.Comparison(exprs[0], '<', exprs[1])
-
-    def visit_logLEExpr(self, o, **kwargs):
-        exprs = tuple(self.visit(c, **kwargs) for c in o)
-        assert len(exprs) == 2
-        return sym.Comparison(exprs[0], '<=', exprs[1])
-
-    def visit_logGTExpr(self, o, **kwargs):
-        exprs = tuple(self.visit(c, **kwargs) for c in o)
-        assert len(exprs) == 2
-        return sym.Comparison(exprs[0], '>', exprs[1])
-
-    def visit_logGEExpr(self, o, **kwargs):
-        exprs = tuple(self.visit(c, **kwargs) for c in o)
-        assert len(exprs) == 2
-        return sym.Comparison(exprs[0], '>=', exprs[1])
-
-    def visit_logEQExpr(self, o, **kwargs):
-        exprs = tuple(self.visit(c, **kwargs) for c in o)
-        assert len(exprs) == 2
-        return sym.Comparison(exprs[0], '==', exprs[1])
+    _comparison_operators = {
+        'logLTExpr': '<', 'logLEExpr': '<=', 'logGTExpr': '>',
+        'logGEExpr': '>=', 'logEQExpr': '==', 'logNEQExpr': '!='
+    }
+    """
+    Comparison operator for each of OMNI's relational expression tags
+    """
 
-    def visit_logNEQExpr(self, o, **kwargs):
-        exprs = tuple(self.visit(c, **kwargs) for c in o)
-        assert len(exprs) == 2
-        return sym.Comparison(exprs[0], '!=', exprs[1])
+    def visit_comparison(self, o, **kwargs):
+        left, right = o
+        operator = self._comparison_operators[o.tag]
+        return sym.Comparison(self.visit(left, **kwargs), operator, self.visit(right, **kwargs))
+
+    visit_logLTExpr = visit_comparison
+    visit_logLEExpr = visit_comparison
+    visit_logGTExpr = visit_comparison
+    visit_logGEExpr = visit_comparison
+    visit_logEQExpr = visit_comparison
+    visit_logNEQExpr = visit_comparison
 
     def visit_logEQVExpr(self, o, **kwargs):
         exprs = tuple(self.visit(c, **kwargs) for c in o)
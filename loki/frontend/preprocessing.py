@@ -8,7 +8,7 @@
 """
 Preprocessing utilities for frontends.
 """
-from collections import defaultdict, OrderedDict
+from collections import defaultdict
 from pathlib import Path
 import io
 import re
@@ -22,7 +22,7 @@ from loki.ir import VariableDeclaration, Intrinsic, FindNodes
 from loki.frontend.util import OMNI, OFP, FP, REGEX
 
 
-__all__ = ['preprocess_cpp', 'sanitize_input', 'sanitize_registry', 'PPRule']
+__all__ = ['preprocess_cpp', 'requires_cpp', 'sanitize_input', 'sanitize_registry', 'PPRule']
 
 
 def preprocess_cpp(source, filepath=None, includes=None, defines=None):
@@ -95,6 +95,37 @@ def preprocess_cpp(source, filepath=None, includes=None, defines=None):
     return s.getvalue()
 
 
+_cpp_trigger_pattern = re.compile(r'^[ \t]*#|\\\n|__', re.MULTILINE)
+"""
+Pattern for anything in a source string that the C-preprocessor acts on
+without symbol definitions: directives, backslash line continuations and
+predefined macros such as ``__FILE__``
+"""
+
+
+def requires_cpp(source, defines=None):
+    """
+    Determine if C-preprocessing may change a source string
+
+    Without symbol definitions, :meth:`preprocess_cpp` leaves sources that
+    contain no preprocessor directives, line continuations or predefined
+    macros unchanged, apart from stripping trailing whitespace.
+
+    Parameters
+    ----------
+    source : str
+        The source string to check
+    defines : (list of) str, optional
+        Symbol definitions that would be passed to the C-preprocessor
+
+    Returns
+    -------
+    bool
+        `True` if :meth:`preprocess_cpp` needs to be applied
+    """
+    return bool(as_tuple(defines)) or _cpp_trigger_pattern.search(source) is not None
+
+
 @Timer(logger=perf, text=lambda s: f'[Loki::Frontend] Executed sanitize_input in {s:.2f}s')
 def sanitize_input(source, frontend):
     """
@@ -110,18 +141,18 @@ def sanitize_input(source, frontend):
     """
 
     # Apply preprocessing rules and store meta-information
-    pp_info = OrderedDict()
+    pp_info = {}
     for name, rule in sanitize_registry[frontend].items():
         # Apply rule filter over source file
         rule.reset()
-        new_source = ''
-        for ll, line in enumerate(source.splitlines(keepends=True)):
-            ll += 1  # Correct for Fortran counting
-            new_source += rule.filter(line, lineno=ll)
+        # Line numbers start at 1 to match Fortran counting
+        source = ''.join(
+            rule.filter(line, lineno=ll)
+            for ll, line in enumerate(source.splitlines(keepends=True), start=1)
+        )
 
         # Store met-information from rule
         pp_info[name] = rule.info
-        source = new_source
 
     return source, pp_info
 
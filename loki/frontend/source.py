@@ -371,6 +371,10 @@ class FortranReader:
 def extract_source(ast, text, label=None, full_lines=False):
     """
     Extract the marked string from source text.
+
+    :data:`text` can be given as a string or, to avoid splitting it on
+    every call, as a list of lines as obtained from
+    ``str.splitlines(keepends=True)``.
     """
     attrib = getattr(ast, 'attrib', ast)
     lstart = int(attrib['line_begin'])
@@ -380,11 +384,31 @@ def extract_source(ast, text, label=None, full_lines=False):
     return extract_source_from_range((lstart, lend), (cstart, cend), text, label=label, full_lines=full_lines)
 
 
+def _is_continued(line):
+    """
+    Scan for line continuations and honour inline comments in between
+    continued lines
+    """
+    return line.partition('!')[0].strip().endswith('&')
+
+
+def _is_comment(line):
+    """
+    Check if the given line is a comment line
+    """
+    return line.lstrip().startswith('!')
+
+
 def extract_source_from_range(lines, columns, text, label=None, full_lines=False):
     """
     Extract the marked string from source text.
+
+    :data:`text` can be given as a string or, to avoid splitting it on
+    every call, as a list of lines as obtained from
+    ``str.splitlines(keepends=True)``.
     """
-    text = text.splitlines(keepends=True)
+    if isinstance(text, str):
+        text = text.splitlines(keepends=True)
     lstart, lend = lines
     cstart, cend = columns
 
@@ -393,30 +417,22 @@ def extract_source_from_range(lines, columns, text, label=None, full_lines=False
 
     lines = text[lstart-1:lend]
 
-    # Scan for line continuations and honour inline
-    # comments in between continued lines
-    def continued(line):
-        if '!' in line:
-            line = line.split('!')[0]
-        return line.strip().endswith('&')
-
-    def is_comment(line):
-        return line.strip().startswith('!')
-
     # We only honour line continuation if we're not parsing a comment
-    if not is_comment(lines[-1]):
-        while continued(lines[-1]) or is_comment(lines[-1]):
+    if not _is_comment(lines[-1]):
+        while _is_continued(lines[-1]) or _is_comment(lines[-1]):
             lend += 1
             # TODO: Strip the leading empty space before the '&'
             lines.append(text[lend-1])
 
     # If line continuation is used, move column index to the relevant parts
-    while cstart >= len(lines[0]):
-        if not is_comment(lines[0]):
-            cstart -= len(lines[0])
-            cend -= len(lines[0])
-        lines = lines[1:]
-        lstart += 1
+    skip = 0
+    while cstart >= len(lines[skip]):
+        if not _is_comment(lines[skip]):
+            cstart -= len(lines[skip])
+            cend -= len(lines[skip])
+        skip += 1
+    lines = lines[skip:]
+    lstart += skip
 
     # Move column index by length of the label if given
     if label is not None:
@@ -27,7 +27,9 @@ from loki import (
 )
 from loki.build import jit_compile, clean_test
 from loki.expression import symbols as sym
-from loki.frontend import available_frontends, OMNI, OFP, FP, REGEX
+from loki.frontend import (
+    available_frontends, OMNI, OFP, FP, REGEX, preprocess_cpp, requires_cpp
+)
 from loki.ir import nodes as ir, FindNodes
 
 
@@ -911,6 +913,24 @@ END SUBROUTINE driver
     assert '#include' in driver.spec.body[0].text
 
 
+@pytest.mark.parametrize('fcode,defines,expected', [
+    ('a = b + c\n! a # comment\n', None, False),
+    ('#include "kernel.intfb.h"\n', None, True),
+    ('  #ifdef FOO\na = b\n  #endif\n', None, True),
+    ('a = b + &\\\n & c\n', None, True),
+    ('print *, __FILE__\n', None, True),
+    ('a = FOO\n', ['FOO=1'], True),
+])
+def test_requires_cpp(fcode, defines, expected):
+    """
+    Verify that sources are only flagged for C-preprocessing when it
+    may change them
+    """
+    assert requires_cpp(fcode, defines=defines) is expected
+    if not expected:
+        assert preprocess_cpp(fcode, defines=defines) == fcode
+
+
 @pytest.mark.parametrize('frontend', available_frontends(
     xfail=[(OMNI, 'Non-standard notation needs full preprocessing')]
 ))
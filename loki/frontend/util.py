@@ -12,8 +12,7 @@ from codetiming import Timer
 from more_itertools import split_after
 
 from loki.ir import (
-    NestedTransformer, FindNodes, PatternFinder, Transformer,
-    Assignment, Comment, CommentBlock, VariableDeclaration,
+    Transformer, Assignment, Comment, CommentBlock, VariableDeclaration,
     ProcedureDeclaration, Loop, Intrinsic, Pragma
 )
 from loki.frontend.source import join_source_list
@@ -25,7 +24,7 @@ __all__ = [
     'Frontend', 'OFP', 'OMNI', 'FP', 'REGEX', 'available_frontends',
     'read_file', 'InlineCommentTransformer',
     'ClusterCommentTransformer', 'CombineMultilinePragmasTransformer',
-    'sanitize_ir'
+    'SanitizeTransformer', 'sanitize_ir'
 ]
 
 
@@ -141,22 +140,84 @@ def match_type_pattern(pattern, sequence):
     return [sequence[i:i+len(pattern)] for i in idx]
 
 
+def _inline_comments(nodes):
+    """
+    Merge inline :any:`Comment` nodes onto the preceding statement in :data:`nodes`
+    """
+    pairs = match_type_pattern(pattern=(Assignment, Comment), sequence=nodes)
+    pairs += match_type_pattern(pattern=(VariableDeclaration, Comment), sequence=nodes)
+    pairs += match_type_pattern(pattern=(ProcedureDeclaration, Comment), sequence=nodes)
+
+    for pair in pairs:
+        # Comment is in-line and can be merged
+        if pair[0].source and pair[1].source:
+            if pair[1].source.lines[0] == pair[0].source.lines[1]:
+                new = pair[0]._rebuild(comment=pair[1])
+                nodes = replace_windowed(nodes, pair, new)
+    return nodes
+
+
+def _cluster_comments(nodes):
+    """
+    Combine consecutive :any:`Comment` nodes in :data:`nodes` into a :any:`CommentBlock`
+    """
+    cgroups = group_by_class(nodes, Comment)
+    for group in cgroups:
+        # Combine the group into a CommentBlock
+        source = join_source_list(tuple(p.source for p in group))
+        block = CommentBlock(comments=group, label=group[0].label, source=source)
+        nodes = replace_windowed(nodes, group, subs=(block,))
+    return nodes
+
+
+def _inline_labels(nodes):
+    """
+    Merge statement labels in :data:`nodes` onto the following node and
+    remove any stale labels
+    """
+    pairs = match_type_pattern(pattern=(Comment, Assignment), sequence=nodes)
+    pairs += match_type_pattern(pattern=(Comment, Intrinsic), sequence=nodes)
+    pairs += match_type_pattern(pattern=(Comment, Loop), sequence=nodes)
+    for pair in pairs:
+        if pair[0].source and pair[0].text == '__STATEMENT_LABEL__':
+            if pair[1].source and pair[1].source.lines[0] == pair[0].source.lines[1]:
+                new = pair[1]._rebuild(label=pair[0].label.lstrip('0'))
+                nodes = replace_windowed(nodes, pair, subs=(new,))
+
+    # Remove any stale labels
+    return tuple(
+        n for n in nodes
+        if not (isinstance(n, Comment) and n.text == '__STATEMENT_LABEL__')
+    )
+
+
+def _combine_multiline_pragmas(nodes):
+    """
+    Combine consecutive multi-line :any:`Pragma` nodes in :data:`nodes` into single ones
+    """
+    pgroups = group_by_class(nodes, Pragma)
+
+    for group in pgroups:
+        # Separate sets of consecutive multi-line pragmas
+        pred = lambda p: not p.content.rstrip().endswith('&')  # pylint: disable=unnecessary-lambda-assignment
+        for pragmaset in split_after(group, pred=pred):
+            # Combine into a single pragma and add to map
+            source = join_source_list(tuple(p.source for p in pragmaset))
+            content = ' '.join(p.content.rstrip(' &') for p in pragmaset)
+            new_pragma = Pragma(
+                keyword=pragmaset[0].keyword, content=content, source=source
+            )
+            nodes = replace_windowed(nodes, pragmaset, subs=(new_pragma,))
+    return nodes
+
+
 class InlineCommentTransformer(Transformer):
     """
     Identify inline comments and merge them onto statements
     """
 
     def visit_tuple(self, o, **kwargs):
-        pairs = match_type_pattern(pattern=(Assignment, Comment), sequence=o)
-        pairs += match_type_pattern(pattern=(VariableDeclaration, Comment), sequence=o)
-        pairs += match_type_pattern(pattern=(ProcedureDeclaration, Comment), sequence=o)
-
-        for pair in pairs:
-            # Comment is in-line and can be merged
-            if pair[0].source and pair[1].source:
-                if pair[1].source.lines[0] == pair[0].source.lines[1]:
-                    new = pair[0]._rebuild(comment=pair[1])
-                    o = replace_windowed(o, pair, new)
+        o = _inline_comments(o)
 
         # Then recurse over the new nodes
         visited = tuple(self.visit(i, **kwargs) for i in o)
@@ -176,12 +237,7 @@ class ClusterCommentTransformer(Transformer):
         """
         Find groups of :any:`Comment` and inject into the tuple.
         """
-        cgroups = group_by_class(o, Comment)
-        for group in cgroups:
-            # Combine the group into a CommentBlock
-            source = join_source_list(tuple(p.source for p in group))
-            block = CommentBlock(comments=group, label=group[0].label, source=source)
-            o = replace_windowed(o, group, subs=(block,))
+        o = _cluster_comments(o)
 
         # Then recurse over the new nodes
         visited = tuple(self.visit(i, **kwargs) for i in o)
@@ -192,31 +248,6 @@ class ClusterCommentTransformer(Transformer):
     visit_list = visit_tuple
 
 
-def inline_labels(ir):
-    """
-    Find labels and merge them onto the following node.
-
-    Note: This is currently only required for OMNI and OFP frontends which
-    has labels as nodes next to the corresponding statement without
-    any connection between both.
-    """
-    pairs = PatternFinder(pattern=(Comment, Assignment)).visit(ir)
-    pairs += PatternFinder(pattern=(Comment, Intrinsic)).visit(ir)
-    pairs += PatternFinder(pattern=(Comment, Loop)).visit(ir)
-    mapper = {}
-    for pair in pairs:
-        if pair[0].source and pair[0].text == '__STATEMENT_LABEL__':
-            if pair[1].source and pair[1].source.lines[0] == pair[0].source.lines[1]:
-                mapper[pair[0]] = None  # Mark for deletion
-                mapper[pair[1]] = pair[1]._rebuild(label=pair[0].label.lstrip('0'))
-
-    # Remove any stale labels
-    for comment in FindNodes(Comment).visit(ir):
-        if comment.text == '__STATEMENT_LABEL__':
-            mapper[comment] = None
-    return NestedTransformer(mapper, invalidate_source=False).visit(ir)
-
-
 def read_file(file_path):
     """
     Reads a file and returns the content as string.
@@ -247,25 +278,51 @@ class CombineMultilinePragmasTransformer(Transformer):
         """
         Finds multi-line pragmas and combines them in-place.
         """
-        pgroups = group_by_class(o, Pragma)
-
-        for group in pgroups:
-            # Separate sets of consecutive multi-line pragmas
-            pred = lambda p: not p.content.rstrip().endswith('&')  # pylint: disable=unnecessary-lambda-assignment
-            for pragmaset in split_after(group, pred=pred):
-                # Combine into a single pragma and add to map
-                source = join_source_list(tuple(p.source for p in pragmaset))
-                content = ' '.join(p.content.rstrip(' &') for p in pragmaset)
-                new_pragma = Pragma(
-                    keyword=pragmaset[0].keyword, content=content, source=source
-                )
-                o = replace_windowed(o, pragmaset, subs=(new_pragma,))
+        o = _combine_multiline_pragmas(o)
+
+        visited = tuple(self.visit(i, **kwargs) for i in o)
+
+        # Strip empty sublists/subtuples or None entries
+        return tuple(i for i in visited if i is not None and as_tuple(i))
+
+
+class SanitizeTransformer(Transformer):
+    """
+    Apply the sanitation steps of :any:`sanitize_ir` in a single traversal.
 
+    For every tuple of sibling nodes, inline comments are merged onto
+    statements, consecutive comments are clustered into a :any:`CommentBlock`
+    and, optionally, statement labels are attached to the following node and
+    multi-line pragmas are combined, before recursing into the new nodes.
+
+    Parameters
+    ----------
+    inline_labels : bool, optional
+        Merge statement labels onto the following node (default: `False`)
+    combine_pragmas : bool, optional
+        Combine multi-line pragmas into single ones (default: `False`)
+    """
+
+    def __init__(self, inline_labels=False, combine_pragmas=False, **kwargs):
+        super().__init__(**kwargs)
+        self.steps = (_inline_comments, _cluster_comments)
+        if inline_labels:
+            self.steps += (_inline_labels,)
+        if combine_pragmas:
+            self.steps += (_combine_multiline_pragmas,)
+
+    def visit_tuple(self, o, **kwargs):
+        for step in self.steps:
+            o = step(o)
+
+        # Then recurse over the new nodes
         visited = tuple(self.visit(i, **kwargs) for i in o)
 
         # Strip empty sublists/subtuples or None entries
         return tuple(i for i in visited if i is not None and as_tuple(i))
 
+    visit_list = visit_tuple
+
 
 @Timer(logger=perf, text=lambda s: f'[Loki::Frontend] Executed sanitize_ir in {s:.2f}s')
 def sanitize_ir(_ir, frontend, pp_registry=None, pp_info=None):
@@ -276,10 +333,14 @@ def sanitize_ir(_ir, frontend, pp_registry=None, pp_info=None):
     It carries out post-processing according to :data:`pp_info` and applies
     the following operations:
 
-    * :any:`inline_comments` to attach inline-comments to IR nodes
+    * :any:`InlineCommentTransformer` to attach inline-comments to IR nodes
     * :any:`ClusterCommentTransformer` to combine multi-line comments into :any:`CommentBlock`
+    * :any:`SanitizeTransformer` with ``inline_labels`` to attach statement labels
+      to IR nodes (OMNI and OFP only)
     * :any:`CombineMultilinePragmasTransformer` to combine multi-line pragmas into a
-      single node
+      single node (FP and OFP only)
+
+    These are fused into a single traversal with :any:`SanitizeTransformer`.
 
     Parameters
     ----------
@@ -299,14 +360,10 @@ def sanitize_ir(_ir, frontend, pp_registry=None, pp_info=None):
             info = pp_info.get(r_name, None)
             _ir = rule.postprocess(_ir, info)
 
-    # Perform some minor sanitation tasks
-    _ir = InlineCommentTransformer(inplace=True, invalidate_source=False).visit(_ir)
-    _ir = ClusterCommentTransformer(inplace=True, invalidate_source=False).visit(_ir)
-
-    if frontend in (OMNI, OFP):
-        _ir = inline_labels(_ir)
-
-    if frontend in (FP, OFP):
-        _ir = CombineMultilinePragmasTransformer(inplace=True, invalidate_source=False).visit(_ir)
+    # Perform some minor sanitation tasks in a single pass over the tree
+    _ir = SanitizeTransformer(
+        inline_labels=frontend in (OMNI, OFP), combine_pragmas=frontend in (FP, OFP),
+        inplace=True, invalidate_source=False
+    ).visit(_ir)
 
     return _ir
@@ -12,8 +12,8 @@ Control flow node classes for
 """
 
 from collections import OrderedDict
-from dataclasses import dataclass
-from functools import partial
+from dataclasses import dataclass, fields
+from functools import lru_cache, partial
 from itertools import chain
 from typing import Any, Tuple, Union
 
@@ -51,6 +51,16 @@ dataclass_validation_config  = {
 # Using this decorator, we can force strict validation
 dataclass_strict = partial(dataclass_validated, config=dataclass_validation_config)
 
+
+@lru_cache(maxsize=None)
+def _field_names(node_cls):
+    """
+    The names of the dataclass fields of the node type :data:`node_cls`,
+    which are determined only once per type
+    """
+    return tuple(f.name for f in fields(node_cls))
+
+
 # Abstract base classes
 
 @dataclass_strict(frozen=True)
@@ -116,7 +126,7 @@ class Node:
         """
         handle = self.args
         argnames = [i for i in self._traversable if i not in kwargs]
-        handle.update(OrderedDict(zip(argnames, args)))
+        handle.update(zip(argnames, args))
         handle.update(kwargs)
         return type(self)(**handle)
 
@@ -146,14 +156,16 @@ class Node:
         """
         Arguments used to construct the Node.
         """
-        return {k: v for k, v in self.__dict__.items() if k in self.__dataclass_fields__.keys()}  # pylint: disable=no-member
+        attrs = self.__dict__
+        return {k: attrs[k] for k in _field_names(type(self))}
 
     @property
     def args_frozen(self):
         """
         Arguments used to construct the Node that cannot be traversed.
         """
-        return {k: v for k, v in self.args.items() if k not in self._traversable}
+        traversable = self._traversable
+        return {k: v for k, v in self.args.items() if k not in traversable}
 
     def __repr__(self):
         raise NotImplementedError
@@ -276,8 +288,8 @@ class ScopedNode(Scope):
         Arguments used to construct the :any:`ScopedNode`, excluding
         the symbol table.
         """
-        keys = tuple(k for k in self.__dataclass_fields__.keys() if k not in ('symbol_attrs', ))  # pylint: disable=no-member
-        return {k: v for k, v in self.__dict__.items() if k in keys}
+        attrs = self.__dict__
+        return {k: attrs[k] for k in _field_names(type(self)) if k != 'symbol_attrs'}
 
     def _update(self, *args, **kwargs):
         if 'symbol_attrs' not in kwargs:
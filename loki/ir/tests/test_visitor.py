@@ -14,7 +14,7 @@ from loki.ir.nodes import (
     Assignment, Associate, Conditional, Loop, Intrinsic, Section
 )
 from loki.ir import (
-    is_parent_of, is_child_of, FindNodes, FindScopes, Transformer,
+    GenericVisitor, is_parent_of, is_child_of, FindNodes, FindScopes, Transformer,
     NestedTransformer, MaskedTransformer, NestedMaskedTransformer,
     Stringifier
 )
@@ -25,6 +25,37 @@ from loki.expression import (
 )
 
 
+def test_generic_visitor_handlers():
+    """
+    Test that handlers are bound to each visitor instance and that invalid
+    handler signatures are rejected for every instantiation.
+    """
+    class CountingVisitor(GenericVisitor):
+
+        def __init__(self, start):
+            super().__init__()
+            self.count = start
+
+        def visit_object(self, o, **kwargs):
+            self.count += 1
+            return self.count
+
+    first, second = CountingVisitor(0), CountingVisitor(10)
+    assert first.visit(1) == 1
+    assert first.visit(2) == 2
+    assert second.visit(1) == 11
+    assert first.count == 2
+
+    class InvalidVisitor(GenericVisitor):
+
+        def visit_object(self):  # pylint: disable=arguments-differ
+            pass
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            InvalidVisitor()
+
+
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_find_nodes_greedy(frontend):
     """
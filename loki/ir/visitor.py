@@ -40,12 +40,34 @@ class GenericVisitor:
             pass
     """
 
+    _handler_names = {}
+    """
+    Cache of the names of handler methods for each visitor class, which
+    avoids inspecting the class every time a visitor is instantiated
+    """
+
     def __init__(self):
-        handlers = {}
+        cls = self.__class__
+        if cls not in GenericVisitor._handler_names:
+            GenericVisitor._handler_names[cls] = self._find_handler_names()
+        self._handlers = {
+            key: getattr(self, name)
+            for key, name in GenericVisitor._handler_names[cls].items()
+        }
+
+    def _find_handler_names(self):
+        """
+        Inspect the methods on this instance to find out which handlers
+        are defined
+
+        Returns
+        -------
+        dict
+            Mapping of type names to the names of their handler methods
+        """
+        names = {}
         # visit methods are spelt visit_Foo.
         prefix = "visit_"
-        # Inspect the methods on this instance to find out which
-        # handlers are defined.
         for (name, meth) in inspect.getmembers(self, predicate=inspect.ismethod):
             if not name.startswith(prefix):
                 continue
@@ -56,8 +78,8 @@ class GenericVisitor:
             if len(argspec.args) < 2:
                 raise RuntimeError("Visit method signature must be "
                                    "visit_Foo(self, o, [*args, **kwargs])")
-            handlers[name[len(prefix):]] = meth
-        self._handlers = handlers
+            names[name[len(prefix):]] = name
+        return names
 
     default_args = {}
     """
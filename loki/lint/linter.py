@@ -10,6 +10,7 @@
 :any:`Sourcefile` objects
 """
 from concurrent.futures import as_completed
+from functools import lru_cache
 import inspect
 from multiprocessing import Manager
 from pathlib import Path
@@ -77,12 +78,26 @@ class Linter:
         list
             A list of rule classes.
         """
-        rule_list = inspect.getmembers(
-            rules_module, lambda obj: inspect.isclass(obj) and obj.__name__ in rules_module.__all__)
+        rule_list = Linter._rules_in_module(rules_module)
         if rule_names is not None:
             rule_list = [r for r in rule_list if r[0] in rule_names]
         return [r[1] for r in rule_list]
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _rules_in_module(rules_module):
+        """
+        Scan a module for rule classes, which is done only once per module
+
+        Returns
+        -------
+        tuple
+            Pairs of rule name and rule class
+        """
+        return tuple(inspect.getmembers(
+            rules_module, lambda obj: inspect.isclass(obj) and obj.__name__ in rules_module.__all__
+        ))
+
     @staticmethod
     def default_config(rules):
         """
@@ -101,9 +116,10 @@ class Linter:
         """
         # List of rules
         config = {'rules': [rule.__name__ for rule in rules]}
-        # Default options for rules
+        # Default options for rules, copied to keep the rules' defaults
+        # intact when the config is updated
         for rule in rules:
-            config[rule.__name__] = rule.config
+            config[rule.__name__] = rule.config.copy()
         return config
 
     def update_config(self, config):
@@ -125,6 +125,9 @@ def test_linter_check(dummy_file, dummy_rules, dummy_handler):
     linter = Linter(reporter, dummy_rules, config=config)
     linter.check(Sourcefile.from_file(dummy_file))
 
+    # Make sure the rules' default config has not been modified
+    assert dummy_rules[0].config == {'key': 'default_value'}
+
 
 def test_linter_transformation(dummy_file, dummy_rules, dummy_handler):
     '''Make sure that linter runs through all given rules and hands them
@@ -14,9 +14,10 @@ from codetiming import Timer
 
 from loki.backend.fgen import fgen
 from loki.backend.cufgen import cufgen
+from loki.config import config
 from loki.frontend import (
     Frontend, OMNI, OFP, FP, REGEX, sanitize_input, Source, read_file, preprocess_cpp,
-    parse_omni_source, parse_ofp_source, parse_fparser_source,
+    requires_cpp, parse_omni_source, parse_ofp_source, parse_fparser_source,
     parse_omni_ast, parse_ofp_ast, parse_fparser_ast, parse_regex_source,
     RegexParserClass
 
@@ -60,7 +61,7 @@ class Sourcefile:
     """
 
     def __init__(self, path, ir=None, ast=None, source=None, incomplete=False, parser_classes=None):
-        self.path = Path(path) if path is not None else path
+        self.path = path if path is None or isinstance(path, Path) else Path(path)
         if ir is not None and not isinstance(ir, Section):
             ir = Section(body=ir)
         self.ir = ir
@@ -171,10 +172,15 @@ class Sourcefile:
         # Always CPP-preprocess source files for OMNI, but optionally
         # use a different set of include paths if specified that way.
         # (It's a hack, I know, but OMNI sucks, so what can I do...?)
+        # Sources without any directives are passed on unchanged, which
+        # saves a costly round-trip through the preprocessor.
         if omni_includes is not None and len(omni_includes) > 0:
             includes = omni_includes
-        source = preprocess_cpp(raw_source, filepath=filepath,
-                                includes=includes, defines=defines)
+        if requires_cpp(raw_source, defines=defines) or config['cpp-dump-files']:
+            source = preprocess_cpp(raw_source, filepath=filepath,
+                                    includes=includes, defines=defines)
+        else:
+            source = raw_source
 
         # Parse the file content into an OMNI Fortran AST
         ast = parse_omni_source(source=source, filepath=filepath, xmods=xmods)
@@ -188,8 +194,9 @@ class Sourcefile:
         Generate the full set of `Subroutine` and `Module` members of the `Sourcefile`.
         """
         type_map = {t.attrib['type']: t for t in typetable}
-        if ast.find('symbols') is not None:
-            symbol_map = {s.attrib['type']: s for s in ast.find('symbols')}
+        symbols = ast.find('symbols')
+        if symbols is not None:
+            symbol_map = {s.attrib['type']: s for s in symbols}
         else:
             symbol_map = None
 
@@ -500,15 +507,16 @@ class Sourcefile:
 
     def __getitem__(self, name):
         name = name.lower()
-        for module in self.modules:
+        modules = self.modules
+        for module in modules:
             if name == module.name.lower():
                 return module
 
-        for routine in self.all_subroutines:
+        for routine in self.routines + as_tuple(flatten(m.subroutines for m in modules)):
             if name == routine.name.lower():
                 return routine
 
-        for module in self.modules:
+        for module in modules:
             for typedef in module.typedefs:
                 if name == typedef.name.lower():
                     return typedef
@@ -360,8 +360,13 @@ class Subroutine(ProgramUnit):
         #Load symbol_map
         #Note that if the map is not loaded, Python will recreate it for every arguement,
         #resulting in a large overhead.
+        #Only create a fallback variable for arguments that have not been declared,
+        #as eagerly constructing it for every argument is similarly expensive.
         symbol_map = self.symbol_map
-        return as_tuple(symbol_map.get(arg, sym.Variable(name=arg)) for arg in self._dummies)
+        return as_tuple(
+            symbol_map[arg] if arg in symbol_map else sym.Variable(name=arg)
+            for arg in self._dummies
+        )
 
     @arguments.setter
     def arguments(self, arguments):
@@ -11,6 +11,7 @@ import re
 import pytest
 
 from loki import read_file, Source, source_to_lines, join_source_list, FortranReader
+from loki.frontend.source import extract_source_from_range
 
 
 @pytest.fixture(scope='module', name='here')
@@ -279,6 +280,23 @@ def test_join_source_list(source_list, expected):
         assert result.file == expected.file
 
 
+@pytest.mark.parametrize('lines,columns,full_lines,expected', [
+    ((1, 1), (2, 5), False, Source((1, 2), '  a = 1 + &\n    &')),
+    ((1, 2), (0, 5), True, Source((1, 2), '  a = 1 + &\n    & 2')),
+    ((3, 3), (2, 7), False, Source((3, 3), '  b = 3')),
+])
+def test_extract_source_from_range(lines, columns, full_lines, expected):
+    """
+    Test the `extract_source_from_range` utility with a string and
+    pre-split lines
+    """
+    text = '  a = 1 + &\n    & 2\n  b = 3\n'
+    for _text in (text, text.splitlines(keepends=True)):
+        result = extract_source_from_range(lines, columns, _text, full_lines=full_lines)
+        assert result.lines == expected.lines
+        assert result.string == expected.string
+
+
 def test_fortran_reader(here):
     """Test :any:`FortranReader` constructor"""
     filepath = here/'sources/Fortran-extract-interface-source.f90'
@@ -204,11 +204,13 @@ def disk_cached(argname, suffix='cache'):
             cachefile = f'{filename}.{suffix}'
 
             # Read cached file from disc if it's been cached before
-            if config['disk-cache'] and os.path.exists(cachefile):
+            if config['disk-cache']:
+                try:
+                    cachetime = os.stat(cachefile).st_mtime
+                except FileNotFoundError:
+                    cachetime = None
                 # Only use cache if it is newer than the file
-                filetime = os.path.getmtime(filename)
-                cachetime = os.path.getmtime(cachefile)
-                if cachetime >= filetime:
+                if cachetime is not None and cachetime >= os.stat(filename).st_mtime:
                     with open(cachefile, 'rb') as cachehandle:
                         info(f'Loading cache: "{cachefile}"')
                         return pickle.load(cachehandle)
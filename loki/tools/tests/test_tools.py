@@ -9,6 +9,7 @@
 Unit tests for utility functions and classes in loki.tools.
 """
 
+import os
 import sys
 import operator as op
 from contextlib import contextmanager
@@ -27,7 +28,8 @@ from loki.config import config_override
 from loki.tools import (
     JoinableStringList, truncate_string, binary_insertion_sort, is_subset,
     optional, yaml_include_constructor, execute, timeout, dict_override,
-    LokiTempdir, stdchannel_is_captured, stdchannel_redirected
+    LokiTempdir, stdchannel_is_captured, stdchannel_redirected,
+    stdchannel_captured, disk_cached
 )
 
 
@@ -264,6 +266,22 @@ main: !include {main_path}
     main_path.unlink()
 
 
+def test_stdchannel_captured(capsys):
+    # This tests works only if stdout/stderr is not captured by pytest
+    if stdchannel_is_captured(capsys):
+        pytest.skip('pytest executed without "--show-capture"/"-s"')
+
+    # Output of a subprocess must arrive in the buffer, even if it exceeds
+    # the capacity of the pipe
+    cmd = [sys.executable, '-c', 'print("Hello\\n"*10000,end="")']
+    with capsys.disabled():
+        with stdchannel_captured(sys.stdout) as output:
+            execute(cmd, silent=False)
+            sys.stdout.write('Goodbye!\n')
+
+    assert output.getvalue() == 'Hello\n' * 10000 + 'Goodbye!\n'
+
+
 def test_execute(here, capsys):
 
     testfile = here/'test_execute.txt'
@@ -388,3 +406,38 @@ def test_loki_tempdir(here):
     # But the parent directory should not be deleted
     assert test_tmpdir.exists()
     test_tmpdir.rmdir()
+
+
+def test_disk_cached(tmp_path):
+    """
+    Test that :any:`disk_cached` reuses results until the file changes
+    """
+    calls = []
+
+    @disk_cached(argname='filename', suffix='testcache')
+    def read_length(filename):
+        calls.append(filename)
+        return len(Path(filename).read_text())
+
+    filepath = tmp_path/'myfile.txt'
+    filepath.write_text('Hello world')
+
+    with config_override({'disk-cache': True}):
+        assert read_length(filename=filepath) == 11
+        assert read_length(filename=filepath) == 11
+        assert len(calls) == 1
+        assert (tmp_path/'myfile.txt.testcache').exists()
+
+        # Updating the file invalidates the cache. The modification time is set
+        # explicitly, as the file system's time resolution may be too coarse
+        filepath.write_text('Hello')
+        cachetime = (tmp_path/'myfile.txt.testcache').stat().st_mtime
+        os.utime(filepath, (cachetime + 10, cachetime + 10))
+        assert read_length(filename=filepath) == 5
+        assert len(calls) == 2
+
+    # Without the option the cache is neither read nor written
+    (tmp_path/'myfile.txt.testcache').unlink()
+    assert read_length(filename=filepath) == 5
+    assert len(calls) == 3
+    assert not (tmp_path/'myfile.txt.testcache').exists()
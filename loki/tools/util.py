@@ -10,6 +10,7 @@ import sys
 import operator as op
 import os
 import io
+import threading
 import weakref
 from functools import lru_cache
 from collections import OrderedDict
@@ -37,7 +38,7 @@ __all__ = [
     'LazyNodeLookup', 'yaml_include_constructor',
     'auto_post_mortem_debugger', 'set_excepthook', 'timeout',
     'WeakrefProperty', 'group_by_class', 'replace_windowed',
-    'dict_override', 'stdchannel_redirected',
+    'dict_override', 'stdchannel_redirected', 'stdchannel_captured',
     'stdchannel_is_captured', 'graphviz_present'
 ]
 
@@ -756,6 +757,58 @@ def stdchannel_redirected(stdchannel, dest_filename):
             dest_file.close()
 
 
+@contextmanager
+def stdchannel_captured(stdchannel):
+    """
+    A context manager to temporarily capture stdout or stderr in memory
+
+    Like :any:`stdchannel_redirected`, this replaces the file descriptor of
+    :data:`stdchannel` and therefore also captures output of compiled code.
+    Instead of writing to a file, the output is collected through a pipe and
+    is available from the yielded :class:`io.StringIO` object once the context
+    has been left:
+
+    .. code-block:: python
+
+       with capsys.disabled():
+           with stdchannel_captured(sys.stdout) as output:
+               function()
+       assert output.getvalue() == 'Hello world!\n'
+
+    The same restrictions with respect to capturing by pytest apply as for
+    :any:`stdchannel_redirected`.
+    """
+    output = io.StringIO()
+    captured = []
+    read_fd, write_fd = os.pipe()
+
+    def drain():
+        # Read continuously to avoid blocking the writer on a full pipe
+        while data := os.read(read_fd, 4096):
+            captured.append(data)
+
+    reader = threading.Thread(target=drain, daemon=True)
+
+    oldstdchannel = None
+    try:
+        reader.start()
+        stdchannel.flush()
+        oldstdchannel = os.dup(stdchannel.fileno())
+        os.dup2(write_fd, stdchannel.fileno())
+        yield output
+    finally:
+        if oldstdchannel is not None:
+            stdchannel.flush()
+            os.dup2(oldstdchannel, stdchannel.fileno())
+            os.close(oldstdchannel)
+        # Closing the last write end of the pipe lets the reader terminate
+        os.close(write_fd)
+        if reader.ident is not None:
+            reader.join()
+        os.close(read_fd)
+        output.write(b''.join(captured).decode())
+
+
 def stdchannel_is_captured(capsys):
     """
     Utility function to verify if pytest captures stdout/stderr.
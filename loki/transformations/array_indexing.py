@@ -216,9 +216,17 @@ def promote_variables(routine, variable_names, pos, index=None, size=None):
         routine.body = Transformer().visit(routine.body)
 
         with dataflow_analysis_attached(routine):
-            for node, var_list in FindVariables(unique=False, with_ir_node=True).visit(routine.body):
-                # All the variables marked for promotion that appear in this IR node
-                var_list = [v for v in var_list if v.name.lower() in variable_names]
+            node_var_lists = FindVariables(unique=False, with_ir_node=True).visit(routine.body)
+
+            # Match the distinct spellings of variable names against the names to
+            # promote only once, instead of for every use of a variable
+            promoted_names = {v.name for _, var_list in node_var_lists for v in var_list}
+            promoted_names = {name for name in promoted_names if name.lower() in variable_names}
+
+            for node, var_list in node_var_lists:
+                # All the variables marked for promotion that appear in this IR node,
+                # with repeated uses of the same variable handled only once
+                var_list = {v for v in var_list if v.name in promoted_names}
 
                 if not var_list:
                     continue
@@ -232,10 +240,7 @@ def promote_variables(routine, variable_names, pos, index=None, size=None):
                 for var in var_list:
                     # If the position is given relative to the end we convert it to
                     # a positive index
-                    if hasattr(var, 'dimensions'):
-                        var_dim = var.dimensions
-                    else:
-                        var_dim = ()
+                    var_dim = getattr(var, 'dimensions', ())
                     if pos < 0:
                         var_pos = len(var_dim) - pos + 1
                     else:
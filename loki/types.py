@@ -13,6 +13,7 @@ Collection of classes to represent type information for symbols used throughout
 
 import weakref
 from enum import Enum
+from functools import lru_cache
 from loki.tools import flatten, as_tuple, LazyNodeLookup
 
 
@@ -69,23 +70,38 @@ class BasicType(DataType, int, Enum):
         """
         Convert the given string representation of the :any:`BasicType`.
         """
-        return {t.name: t for t in cls}[value]
+        return cls[value]
 
     @classmethod
     def from_fortran_type(cls, value):
         """
         Convert the given string representation of a FORTRAN type.
         """
-        type_map = {'logical': cls.LOGICAL, 'integer': cls.INTEGER, 'real': cls.REAL,
-                    'double precision': cls.REAL, 'double complex': cls.COMPLEX,
-                    'character': cls.CHARACTER, 'complex': cls.COMPLEX}
-        return type_map[value.lower()]
+        return cls._fortran_type_map()[value.lower()]
 
     @classmethod
     def from_c99_type(cls, value):
         """
         Convert the given string representation of a C99 type.
         """
+        return cls._c99_type_map()[value]
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _fortran_type_map(cls):
+        """
+        Mapping of FORTRAN type names to :any:`BasicType`, built on first use
+        """
+        return {'logical': cls.LOGICAL, 'integer': cls.INTEGER, 'real': cls.REAL,
+                'double precision': cls.REAL, 'double complex': cls.COMPLEX,
+                'character': cls.CHARACTER, 'complex': cls.COMPLEX}
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _c99_type_map(cls):
+        """
+        Mapping of C99 type names to :any:`BasicType`, built on first use
+        """
         logical_types = ['bool', '_Bool']
         integer_types = ['short', 'int', 'long', 'long long']
         integer_types += flatten([(f'signed {t}', f'unsigned {t}') for t in integer_types])
@@ -98,8 +114,7 @@ class BasicType(DataType, int, Enum):
         type_map.update({t: cls.REAL for t in real_types})
         type_map.update({t: cls.CHARACTER for t in character_types})
         type_map.update({t: cls.COMPLEX for t in complex_types})
-
-        return type_map[value]
+        return type_map
 
 
 class DerivedType(DataType):
@@ -384,14 +399,29 @@ class SymbolAttributes:
     def __hash__(self):
         return hash(tuple(self.__dict__))
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _class_attributes(attrs_cls):
+        """
+        The names of all attributes defined on :data:`attrs_cls` and its bases
+        """
+        return frozenset(dir(attrs_cls))
+
+    def _has_attribute(self, name):
+        """
+        Equivalent of ``name in dir(self)`` that avoids building and sorting
+        the full attribute list on every call
+        """
+        return name in self.__dict__ or name in self._class_attributes(type(self))
+
     def __setattr__(self, name, value):
-        if value is None and name in dir(self):
+        if value is None and self._has_attribute(name):
             delattr(self, name)
         else:
             object.__setattr__(self, name, value)
 
     def __getattr__(self, name):
-        if name not in dir(self):
+        if not self._has_attribute(name):
             return None
         return object.__getattribute__(self, name)
 